@@ -11,9 +11,15 @@ from __future__ import annotations
 
 import asyncio
 import json
+import logging
 from typing import Any, Dict, Optional
 
+import aiohttp
+
 from config import Config
+import fast_json
+
+log = logging.getLogger("telephony.admin_client")
 
 
 def normalize_auth_header(auth_header: str) -> str:
@@ -40,13 +46,24 @@ def normalize_auth_header(auth_header: str) -> str:
 
 
 class AdminClient:
-    """Async client for Admin UI API and webhook delivery."""
+    """
+    Async client for Admin UI API and webhook delivery.
+
+    Pass the server's shared aiohttp session as `http_session` so pushes reuse
+    pooled keep-alive connections across calls; without one, each request runs
+    urllib in a worker thread on a fresh connection.
+    """
 
-    def __init__(self, cfg: Optional[Config] = None):
+    def __init__(
+        self,
+        cfg: Optional[Config] = None,
+        http_session: Optional[aiohttp.ClientSession] = None,
+    ):
         self.cfg = cfg or Config()
         self.base_url = self.cfg.ADMIN_API_BASE.rstrip("/")
         self.ingest_url = f"{self.base_url}/api/calls/ingest"
         self.timeout = 10  # seconds
+        self.http_session = http_session
         self._agent_config_cache: Dict[str, Dict[str, Any]] = {}
 
     async def push_call_data(
@@ -70,12 +87,68 @@ class AdminClient:
             return False
 
         try:
-            # Use aiohttp if available, fall back to sync urllib
+            # Use the shared aiohttp session if available, fall back to sync urllib
+            if self.http_session is not None and not self.http_session.closed:
+                return await self._push_with_aiohttp(payload, call_id)
             return await self._push_with_urllib(payload, call_id)
         except Exception as e:
-            print(f"[{call_id}] ❌ Admin push failed: {e}")
+            log.error("[%s] ❌ Admin push failed: %s", call_id, e)
+            return False
+
+    async def _push_with_aiohttp(
+        self,
+        payload: Dict[str, Any],
+        call_id: str,
+    ) -> bool:
+        """Push over the shared aiohttp session (pooled keep-alive connections)."""
+        # Serialized once up front; redirects resend the same body
+        data = fast_json.dumps(payload).encode("utf-8")
+        headers = {
+            "Content-Type": "application/json",
+            "Accept": "application/json",
+        }
+        url = self.ingest_url
+        max_redirects = 3
+
+        try:
+            for attempt in range(max_redirects + 1):
+                # Redirects are followed manually so 301/302 re-POST the body
+                # (as the urllib path does) instead of turning into a GET
+                async with self.http_session.post(
+                    url,
+                    data=data,
+                    headers=headers,
+                    allow_redirects=False,
+                    timeout=aiohttp.ClientTimeout(total=self.timeout),
+                ) as resp:
+                    if resp.status in (301, 302, 303, 307, 308):
+                        new_url = resp.headers.get("Location")
+                        if new_url and attempt < max_redirects:
+                            # Handle relative URLs
+                            if new_url.startswith("/"):
+                                new_url = f"{self.base_url}{new_url}"
+                            log.info("[%s] 🔄 Following redirect to: %s", call_id, new_url)
+                            url = new_url
+                            continue
+                    if resp.status == 200:
+                        result = await resp.json(content_type=None)
+                        log.info("[%s] ✅ Pushed to Admin UI: %s", call_id, result.get('callSessionId', 'OK'))
+                        return True
+                    if resp.status >= 300:
+                        log.warning("[%s] ⚠️ Admin UI HTTP error: %s %s", call_id, resp.status, resp.reason)
+                    else:
+                        log.warning("[%s] ⚠️ Admin UI returned status %s", call_id, resp.status)
+                    return False
+        except aiohttp.ClientConnectionError as e:
+            log.warning("[%s] ⚠️ Admin UI connection error: %s", call_id, e)
+            return False
+        except Exception as e:
+            log.warning("[%s] ⚠️ Admin UI request error: %s", call_id, e)
             return False
 
+        log.warning("[%s] ⚠️ Too many redirects", call_id)
+        return False
+
     async def _push_with_urllib(
         self,
         payload: Dict[str, Any],
@@ -85,13 +158,15 @@ class AdminClient:
         import urllib.request
         import urllib.error
 
+        # Serialized once up front; redirects resend the same body
+        data = fast_json.dumps(payload).encode("utf-8")
+
         def do_request() -> bool:
             url = self.ingest_url
             max_redirects = 3
             
             for attempt in range(max_redirects + 1):
                 try:
-                    data = json.dumps(payload).encode("utf-8")
                     req = urllib.request.Request(
                         url,
                         data=data,
@@ -114,10 +189,13 @@ class AdminClient:
                         resp = opener.open(req, timeout=self.timeout)
                         if resp.status == 200:
                             result = json.loads(resp.read().decode("utf-8"))
-                            print(f"[{call_id}] ✅ Pushed to Admin UI: {result.get('callSessionId', 'OK')}")
+                            log.info(
+                                "[%s] ✅ Pushed to Admin UI: %s",
+                                call_id, result.get('callSessionId', 'OK'),
+                            )
                             return True
                         else:
-                            print(f"[{call_id}] ⚠️ Admin UI returned status {resp.status}")
+                            log.warning("[%s] ⚠️ Admin UI returned status %s", call_id, resp.status)
                             return False
                     except urllib.error.HTTPError as e:
                         # Handle redirects (307, 308 preserve method)
@@ -127,22 +205,22 @@ class AdminClient:
                                 # Handle relative URLs
                                 if new_url.startswith("/"):
                                     new_url = f"{self.base_url}{new_url}"
-                                print(f"[{call_id}] 🔄 Following redirect to: {new_url}")
+                                log.info("[%s] 🔄 Following redirect to: %s", call_id, new_url)
                                 url = new_url
                                 continue
                         raise
 
                 except urllib.error.HTTPError as e:
-                    print(f"[{call_id}] ⚠️ Admin UI HTTP error: {e.code} {e.reason}")
+                    log.warning("[%s] ⚠️ Admin UI HTTP error: %s %s", call_id, e.code, e.reason)
                     return False
                 except urllib.error.URLError as e:
-                    print(f"[{call_id}] ⚠️ Admin UI connection error: {e.reason}")
+                    log.warning("[%s] ⚠️ Admin UI connection error: %s", call_id, e.reason)
                     return False
                 except Exception as e:
-                    print(f"[{call_id}] ⚠️ Admin UI request error: {e}")
+                    log.warning("[%s] ⚠️ Admin UI request error: %s", call_id, e)
                     return False
             
-            print(f"[{call_id}] ⚠️ Too many redirects")
+            log.warning("[%s] ⚠️ Too many redirects", call_id)
             return False
 
         # Run sync request in thread pool to not block event loop
@@ -161,7 +239,7 @@ class AdminClient:
         try:
             asyncio.create_task(self.push_call_data(payload, call_id))
         except Exception as e:
-            print(f"[{call_id}] ⚠️ Failed to schedule Admin push: {e}")
+            log.warning("[%s] ⚠️ Failed to schedule Admin push: %s", call_id, e)
 
     def fetch_agent_config(self, agent_slug: str) -> Optional[Dict[str, Any]]:
         """
@@ -197,9 +275,9 @@ class AdminClient:
                     self._agent_config_cache[agent_slug] = config
                     return config
         except urllib.error.HTTPError as e:
-            print(f"[telephony] ⚠️ Failed to fetch config for {agent_slug}: HTTP {e.code}")
+            log.warning("[telephony] ⚠️ Failed to fetch config for %s: HTTP %s", agent_slug, e.code)
         except Exception as e:
-            print(f"[telephony] ⚠️ Failed to fetch config for {agent_slug}: {e}")
+            log.warning("[telephony] ⚠️ Failed to fetch config for %s: %s", agent_slug, e)
         
         return None
 
@@ -227,43 +305,44 @@ class AdminClient:
         if not endpoint_url:
             return {"success": False, "status_code": 0, "response_body": "No endpoint configured"}
         
-        # Log the payload being sent (truncated for readability)
-        payload_json = json.dumps(payload, indent=2)
-        if len(payload_json) > 1000:
-            payload_preview = payload_json[:1000] + "\n  ... (truncated)"
-        else:
-            payload_preview = payload_json
-        print(f"[{call_id}] 📤 {webhook_name} Payload:\n{payload_preview}")
+        # The log copy stays indented for reading; the request body is compact
+        if log.isEnabledFor(logging.INFO):
+            payload_preview = json.dumps(payload, indent=2)
+            if len(payload_preview) > 1000:
+                payload_preview = payload_preview[:1000] + "\n  ... (truncated)"
+            log.info("[%s] 📤 %s Payload:\n%s", call_id, webhook_name, payload_preview)
+        data = fast_json.dumps(payload).encode("utf-8")
+        headers = {
+            "Content-Type": "application/json",
+            "Accept": "application/json",
+            "User-Agent": "KiaVoiceAgent/1.0",
+        }
+        # Add authorization header if provided (auto-add Bearer prefix if missing)
+        if auth_header:
+            headers["Authorization"] = normalize_auth_header(auth_header)
+
+        if self.http_session is not None and not self.http_session.closed:
+            return await self._post_webhook_aiohttp(data, endpoint_url, headers, call_id, webhook_name)
         
         import urllib.request
         import urllib.error
         
         def do_request() -> Dict[str, Any]:
             try:
-                data = json.dumps(payload).encode("utf-8")
                 req = urllib.request.Request(
                     endpoint_url,
                     data=data,
                     method="POST",
-                    headers={
-                        "Content-Type": "application/json",
-                        "Accept": "application/json",
-                        "User-Agent": "KiaVoiceAgent/1.0",
-                    },
+                    headers=headers,
                 )
                 
-                # Add authorization header if provided (auto-add Bearer prefix if missing)
-                if auth_header:
-                    normalized_auth = normalize_auth_header(auth_header)
-                    req.add_header("Authorization", normalized_auth)
-                
                 with urllib.request.urlopen(req, timeout=self.timeout) as resp:
                     response_body = resp.read().decode("utf-8")
                     if resp.status in (200, 201, 202):
-                        print(f"[{call_id}] ✅ {webhook_name} webhook delivered: {resp.status}")
+                        log.info("[%s] ✅ %s webhook delivered: %s", call_id, webhook_name, resp.status)
                         return {"success": True, "status_code": resp.status, "response_body": response_body}
                     else:
-                        print(f"[{call_id}] ⚠️ {webhook_name} webhook returned: {resp.status}")
+                        log.warning("[%s] ⚠️ %s webhook returned: %s", call_id, webhook_name, resp.status)
                         return {"success": False, "status_code": resp.status, "response_body": response_body}
                         
             except urllib.error.HTTPError as e:
@@ -272,21 +351,63 @@ class AdminClient:
                     error_body = e.read().decode("utf-8")[:500]
                 except:
                     pass
-                print(f"[{call_id}] ❌ {webhook_name} webhook HTTP error: {e.code} {e.reason}")
+                log.error("[%s] ❌ %s webhook HTTP error: %s %s", call_id, webhook_name, e.code, e.reason)
                 if error_body:
-                    print(f"[{call_id}]    Response: {error_body[:200]}")
+                    log.error("[%s]    Response: %s", call_id, error_body[:200])
                 return {"success": False, "status_code": e.code, "response_body": error_body or f"{e.code} {e.reason}"}
             except urllib.error.URLError as e:
-                print(f"[{call_id}] ❌ {webhook_name} webhook connection error: {e.reason}")
+                log.error("[%s] ❌ %s webhook connection error: %s", call_id, webhook_name, e.reason)
                 return {"success": False, "status_code": 0, "response_body": f"Connection error: {e.reason}"}
             except Exception as e:
-                print(f"[{call_id}] ❌ {webhook_name} webhook error: {e}")
+                log.error("[%s] ❌ %s webhook error: %s", call_id, webhook_name, e)
                 return {"success": False, "status_code": 0, "response_body": f"Error: {e}"}
         
         # Run sync request in thread pool to not block event loop
         loop = asyncio.get_event_loop()
         return await loop.run_in_executor(None, do_request)
 
+    async def _post_webhook_aiohttp(
+        self,
+        data: bytes,
+        endpoint_url: str,
+        headers: Dict[str, str],
+        call_id: str,
+        webhook_name: str,
+    ) -> Dict[str, Any]:
+        """POST a serialized webhook payload over the shared aiohttp session."""
+        try:
+            async with self.http_session.post(
+                endpoint_url,
+                data=data,
+                headers=headers,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+            ) as resp:
+                response_body = await resp.text(errors="replace")
+                if resp.status in (200, 201, 202):
+                    log.info("[%s] ✅ %s webhook delivered: %s", call_id, webhook_name, resp.status)
+                    return {"success": True, "status_code": resp.status, "response_body": response_body}
+                if resp.status >= 400:
+                    error_body = response_body[:500]
+                    log.error(
+                        "[%s] ❌ %s webhook HTTP error: %s %s",
+                        call_id, webhook_name, resp.status, resp.reason,
+                    )
+                    if error_body:
+                        log.error("[%s]    Response: %s", call_id, error_body[:200])
+                    return {
+                        "success": False,
+                        "status_code": resp.status,
+                        "response_body": error_body or f"{resp.status} {resp.reason}",
+                    }
+                log.warning("[%s] ⚠️ %s webhook returned: %s", call_id, webhook_name, resp.status)
+                return {"success": False, "status_code": resp.status, "response_body": response_body}
+        except aiohttp.ClientConnectionError as e:
+            log.error("[%s] ❌ %s webhook connection error: %s", call_id, webhook_name, e)
+            return {"success": False, "status_code": 0, "response_body": f"Connection error: {e}"}
+        except Exception as e:
+            log.error("[%s] ❌ %s webhook error: %s", call_id, webhook_name, e)
+            return {"success": False, "status_code": 0, "response_body": f"Error: {e}"}
+
     async def push_to_si_webhook(
         self,
         payload: Dict[str, Any],
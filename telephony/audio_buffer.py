@@ -0,0 +1,113 @@
+"""
+PCM ring buffer used as the per-session playback queue.
+
+Gemini audio is resampled to 8kHz and queued here until `_audio_sender`
+drip-feeds it to telephony. The queue is a fixed numpy int16 array with a
+read index and a sample count, so:
+
+- reading a chunk is a contiguous copy (no list slicing / re-allocation)
+- barge-in `clear()` is two integer assignments, independent of queue depth
+"""
+
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+import numpy as np
+
+Samples = Union[np.ndarray, Sequence[int]]
+
+
+class PCMRingBuffer:
+    """Growable circular buffer of int16 PCM samples."""
+
+    def __init__(self, capacity: int = 16000):
+        self._buf = np.zeros(max(int(capacity), 1), dtype=np.int16)
+        self._head = 0  # index of the oldest buffered sample
+        self._size = 0  # number of buffered samples
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __bool__(self) -> bool:
+        return self._size > 0
+
+    @property
+    def capacity(self) -> int:
+        return self._buf.size
+
+    def clear(self) -> None:
+        """Drop all buffered audio (O(1) — samples are not touched)."""
+        self._head = 0
+        self._size = 0
+
+    def _grow(self, needed: int) -> None:
+        new_cap = max(self._buf.size * 2, needed)
+        new_buf = np.zeros(new_cap, dtype=np.int16)
+        new_buf[: self._size] = self._peek(self._size)
+        self._buf = new_buf
+        self._head = 0
+
+    def _peek(self, n: int, offset: int = 0) -> np.ndarray:
+        """Return a copy of `n` samples starting `offset` samples after head."""
+        cap = self._buf.size
+        start = (self._head + offset) % cap
+        end = start + n
+        if end <= cap:
+            return self._buf[start:end].copy()
+        return np.concatenate((self._buf[start:], self._buf[: end - cap]))
+
+    def _put(self, samples: np.ndarray, offset: int) -> None:
+        """Write `samples` starting `offset` samples after head (may wrap)."""
+        cap = self._buf.size
+        start = (self._head + offset) % cap
+        first = min(samples.size, cap - start)
+        self._buf[start : start + first] = samples[:first]
+        if first < samples.size:
+            self._buf[: samples.size - first] = samples[first:]
+
+    def extend(self, samples: Samples) -> None:
+        """Append samples at the tail, growing the backing array if needed."""
+        arr = np.asarray(samples, dtype=np.int16)
+        if arr.size == 0:
+            return
+        if self._size == 0:
+            # Empty: restart at index 0 so a fresh response is one contiguous
+            # block (single memcpy in, no wrap-around concatenate on read)
+            self._head = 0
+        if self._size + arr.size > self._buf.size:
+            self._grow(self._size + arr.size)
+        self._put(arr, self._size)
+        self._size += arr.size
+
+    def read(self, n: int) -> np.ndarray:
+        """Pop up to `n` samples from the head."""
+        n = min(n, self._size)
+        out = self._peek(n)
+        self._head = (self._head + n) % self._buf.size
+        self._size -= n
+        return out
+
+    def extend_crossfaded(self, samples: np.ndarray, ramp: np.ndarray) -> None:
+        """
+        Append `samples`, crossfading its start into the buffered tail.
+
+        The last len(ramp) buffered samples are blended in place with the
+        matching leading samples (weight ramp[i] on the new audio), and the rest
+        of `samples` is appended. With fewer samples buffered than len(ramp),
+        only the available tail is blended against the end of the ramp.
+        """
+        n = min(ramp.size, self._size)
+        if n == 0:
+            self.extend(samples)
+            return
+        skip = ramp.size - n
+        alpha = ramp[skip:]
+        # Blend the tail where it sits in the ring: a plain slice unless it
+        # wraps past the end of the backing array, then an index array
+        cap = self._buf.size
+        start = (self._head + self._size - n) % cap
+        where = slice(start, start + n) if start + n <= cap else np.arange(start, start + n) % cap
+        mixed = self._buf[where] * (1.0 - alpha) + samples[skip : ramp.size] * alpha
+        self._buf[where] = mixed.astype(np.int16)  # truncates like int()
+        self.extend(samples[ramp.size :])
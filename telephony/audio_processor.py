@@ -5,17 +5,41 @@ Audio processing for Waybeo telephony ↔ Gemini Live.
 - Gemini input: 16kHz int16 PCM (base64)
 - Gemini output: typically 24kHz int16 PCM (base64) → downsample back to 8kHz for telephony
 
-We use librosa for high-quality resampling (same approach as the singleinterface telephony release).
+When soxr is installed each call gets its own pair of streaming SoX resamplers
+(AudioProcessor.for_session()), so filter state carries across chunk boundaries and
+the resample kernel runs in SIMD C.
+
+Without soxr we fall back to the same polyphase resampling as librosa's "polyphase" mode
+(same approach as the singleinterface telephony release), with each rate pair's FIR filter
+designed once per process. That path holds no per-call state, so sessions share one
+instance per AudioRates via get_audio_processor().
 """
 
 from __future__ import annotations
 
-import base64
+import binascii
+import math
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import List
 
-import librosa
 import numpy as np
+from scipy.signal import firwin, resample_poly
+
+try:
+    import soxr
+except ImportError:  # optional: falls back to scipy polyphase per chunk
+    soxr = None
+
+try:
+    # SIMD base64 codec; Gemini audio frames are tens of KB of base64 each.
+    # b64encode_as_string builds the str directly (no bytes + .decode copy).
+    from pybase64 import b64decode as _b64decode, b64encode_as_string as _b64encode_str
+except ImportError:  # optional: binascii is the C codec behind the base64 module
+    _b64decode = binascii.a2b_base64
+
+    def _b64encode_str(data: bytes) -> str:
+        return binascii.b2a_base64(data, newline=False).decode("ascii")
 
 
 @dataclass(frozen=True)
@@ -25,9 +49,54 @@ class AudioRates:
     gemini_output_sr: int = 24000
 
 
+@lru_cache(maxsize=None)
+def _polyphase_filter(up: int, down: int) -> np.ndarray:
+    """Low-pass FIR taps for an up/down polyphase resample (scipy's default kaiser design)."""
+    max_rate = max(up, down)
+    taps = firwin(2 * 10 * max_rate + 1, 1.0 / max_rate, window=("kaiser", 5.0))
+    return taps.astype(np.float32)
+
+
 class AudioProcessor:
-    def __init__(self, rates: AudioRates):
+    def __init__(self, rates: AudioRates, streaming: bool = False):
         self.rates = rates
+        # Per-call soxr streams (None → stateless per-chunk polyphase resampling)
+        self._up = None
+        self._down = None
+        if streaming and soxr is not None:
+            # Uplink: "QQ" adds no buffering delay (higher qualities hold back ~60ms);
+            # the 8kHz input is already band-limited, so upsampling quality is not critical.
+            self._up = soxr.ResampleStream(
+                rates.telephony_sr, rates.gemini_input_sr, 1, dtype="float32", quality="QQ"
+            )
+            # Downlink needs a proper anti-alias filter; its delay line is drained by flush_output().
+            self._down = soxr.ResampleStream(
+                rates.gemini_output_sr, rates.telephony_sr, 1, dtype="float32", quality="HQ"
+            )
+
+    @property
+    def continuous_output(self) -> bool:
+        """True when consecutive output chunks are phase-continuous (no boundary crossfade needed)."""
+        return self._down is not None
+
+    def for_session(self) -> "AudioProcessor":
+        """Processor for one call: fresh soxr streams if available, else this shared instance."""
+        if soxr is None:
+            return self
+        return AudioProcessor(self.rates, streaming=True)
+
+    def flush_output(self) -> np.ndarray:
+        """Return downlink samples still held in the resampler and reset it (call at end of turn)."""
+        if self._down is None:
+            return np.zeros(0, dtype=np.int16)
+        out_f = self._down.resample_chunk(np.zeros(0, dtype=np.float32), last=True)
+        self._down.clear()
+        return self.float32_to_int16(out_f)
+
+    def reset_output(self) -> None:
+        """Drop buffered downlink resampler state (e.g. on barge-in)."""
+        if self._down is not None:
+            self._down.clear()
 
     @staticmethod
     def int16_to_float32(samples: np.ndarray) -> np.ndarray:
@@ -35,18 +104,27 @@ class AudioProcessor:
 
     @staticmethod
     def float32_to_int16(samples: np.ndarray) -> np.ndarray:
-        # gentle gain reduction to reduce clipping artifacts
-        samples = samples * 0.90
-        samples = np.clip(samples, -1.0, 1.0)
-        return np.round(samples * 32767.0).astype(np.int16)
+        # gentle gain reduction to reduce clipping artifacts; one scratch array,
+        # the remaining steps run in place on it
+        out = np.multiply(samples, 0.90)
+        np.clip(out, -1.0, 1.0, out=out)
+        np.multiply(out, 32767.0, out=out)
+        np.rint(out, out=out)
+        return out.astype(np.int16)
 
     def resample_int16(self, samples: np.ndarray, orig_sr: int, target_sr: int) -> np.ndarray:
         if samples.size == 0 or orig_sr == target_sr:
             return samples.astype(np.int16, copy=False)
         samples_f = self.int16_to_float32(samples)
-        out_f = librosa.resample(
-            samples_f, orig_sr=orig_sr, target_sr=target_sr, res_type="polyphase"
-        )
+        g = math.gcd(orig_sr, target_sr)
+        up, down = target_sr // g, orig_sr // g
+        out_f = resample_poly(samples_f, up, down, window=_polyphase_filter(up, down))
+        return self.float32_to_int16(out_f)
+
+    def _resample_stream(self, stream, samples: np.ndarray) -> np.ndarray:
+        if samples.size == 0:
+            return samples.astype(np.int16, copy=False)
+        out_f = stream.resample_chunk(self.int16_to_float32(samples))
         return self.float32_to_int16(out_f)
 
     @staticmethod
@@ -61,38 +139,54 @@ class AudioProcessor:
         return out
 
     def waybeo_samples_to_np(self, samples: List[int]) -> np.ndarray:
-        return np.array(samples, dtype=np.int16)
+        # fromiter with a known count fills one preallocated int16 array
+        return np.fromiter(samples, dtype=np.int16, count=len(samples))
+
+    @staticmethod
+    def pcm16_bytes_to_np(data: bytes) -> np.ndarray:
+        return np.frombuffer(data, dtype=np.int16)
 
     def np_to_waybeo_samples(self, samples: np.ndarray) -> List[int]:
         return samples.astype(np.int16, copy=False).tolist()
 
     # ---- Input (Waybeo -> Gemini) ----
     def process_input_8k_to_gemini_16k_b64(self, samples_8k: np.ndarray) -> str:
-        samples_16k = self.resample_int16(
-            samples_8k, orig_sr=self.rates.telephony_sr, target_sr=self.rates.gemini_input_sr
-        )
-        return base64.b64encode(samples_16k.tobytes()).decode("utf-8")
+        if self._up is not None:
+            samples_16k = self._resample_stream(self._up, samples_8k)
+        else:
+            samples_16k = self.resample_int16(
+                samples_8k, orig_sr=self.rates.telephony_sr, target_sr=self.rates.gemini_input_sr
+            )
+        # The encoder reads the array's buffer directly; no intermediate bytes copy
+        return _b64encode_str(np.ascontiguousarray(samples_16k))
 
     # ---- Output (Gemini -> Waybeo) ----
-    def process_output_gemini_b64_to_8k_samples(self, audio_b64: str, apply_fade: bool = False) -> List[int]:
+    def process_output_gemini_b64_to_8k_samples(self, audio_b64: str, apply_fade: bool = False) -> np.ndarray:
         """
-        Convert Gemini audio output to Waybeo format.
+        Convert Gemini audio output to 8kHz int16 samples for the playback queue.
         
         Args:
             audio_b64: Base64 encoded audio from Gemini (24kHz int16 PCM)
             apply_fade: Whether to apply fade in/out (only use at conversation boundaries)
         """
-        raw = base64.b64decode(audio_b64)
+        raw = _b64decode(audio_b64)
         # Gemini audio output is int16 PCM
         samples_out = np.frombuffer(raw, dtype=np.int16)
-        samples_8k = self.resample_int16(
-            samples_out,
-            orig_sr=self.rates.gemini_output_sr,
-            target_sr=self.rates.telephony_sr,
-        )
+        if self._down is not None:
+            samples_8k = self._resample_stream(self._down, samples_out)
+        else:
+            samples_8k = self.resample_int16(
+                samples_out,
+                orig_sr=self.rates.gemini_output_sr,
+                target_sr=self.rates.telephony_sr,
+            )
         # Only apply fade at conversation boundaries, not on every chunk
         if apply_fade:
             samples_8k = self.apply_fade(samples_8k)
-        return self.np_to_waybeo_samples(samples_8k)
+        return samples_8k
 
 
+@lru_cache(maxsize=None)
+def get_audio_processor(rates: AudioRates) -> AudioProcessor:
+    """Process-wide AudioProcessor for a given rate configuration."""
+    return AudioProcessor(rates)
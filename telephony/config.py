@@ -41,6 +41,10 @@ class Config:
         "GEMINI_MODEL", "gemini-live-2.5-flash-native-audio"
     )
     GEMINI_VOICE: str = os.getenv("GEMINI_VOICE", "Aoede")
+    # Pre-dialed Gemini Live sockets kept ready for new calls (0 = dial per call)
+    GEMINI_WARM_POOL: int = int(os.getenv("GEMINI_WARM_POOL", "0"))
+    # Idle pooled sockets older than this are closed and redialed
+    GEMINI_WARM_POOL_MAX_IDLE_SEC: float = float(os.getenv("GEMINI_WARM_POOL_MAX_IDLE_SEC", "60"))
 
     # Audio
     TELEPHONY_SR: int = int(os.getenv("TELEPHONY_SR", "8000"))  # Waybeo input/output
@@ -50,12 +54,17 @@ class Config:
     # Buffers (ms) - smaller = lower latency, larger = more stable
     AUDIO_BUFFER_MS_INPUT: int = int(os.getenv("AUDIO_BUFFER_MS_INPUT", "100"))
     AUDIO_BUFFER_MS_OUTPUT: int = int(os.getenv("AUDIO_BUFFER_MS_OUTPUT", "100"))
+    # Let the output sender merge missed chunks into one larger frame after a stall
+    # (only enable if the telephony provider accepts frames longer than AUDIO_BUFFER_MS_OUTPUT)
+    ALLOW_SEND_COALESCE: bool = _env_bool("ALLOW_SEND_COALESCE", False)
 
     # Data Storage
     DATA_BASE_DIR: str = os.getenv("DATA_BASE_DIR", "/data")
     ADMIN_API_BASE: str = os.getenv("ADMIN_API_BASE", "http://127.0.0.1:3100")
     ENABLE_DATA_STORAGE: bool = _env_bool("ENABLE_DATA_STORAGE", True)
     ENABLE_ADMIN_PUSH: bool = _env_bool("ENABLE_ADMIN_PUSH", True)
+    # Transcript entries kept in memory per call; older ones are spooled to disk (0 = keep all)
+    MAX_LIVE_TRANSCRIPT_ENTRIES: int = int(os.getenv("MAX_LIVE_TRANSCRIPT_ENTRIES", "200"))
 
     # Gemini API for intelligent data extraction (uses Gemini 2.0 Flash)
     GEMINI_API_KEY: str = os.getenv("GEMINI_API_KEY", "")
@@ -96,6 +105,7 @@ class Config:
         print(f"Server: ws://{self.HOST}:{self.PORT}{self.WS_PATH}")
         print(f"Gemini model: {self.GEMINI_MODEL}")
         print(f"Voice: {self.GEMINI_VOICE}")
+        print(f"Gemini warm pool: {self.GEMINI_WARM_POOL}")
         print(f"Location: {self.GEMINI_LOCATION}")
         print(f"Project: {self.GCP_PROJECT_ID}")
         print(
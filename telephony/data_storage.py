@@ -12,13 +12,17 @@ Saves transcripts and payloads to agent-specific directories:
 from __future__ import annotations
 
 import json
+import logging
 import os
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
+import fast_json
 from config import Config, get_agent_dir
 
+log = logging.getLogger("telephony.data_storage")
+
 
 def consolidate_transcript(conversation: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     """
@@ -108,7 +112,7 @@ class AgentDataStorage:
         call_id: str,
         conversation: List[Dict[str, Any]],
         metadata: Optional[Dict[str, Any]] = None,
-    ) -> Optional[str]:
+    ) -> Tuple[Optional[str], Optional[Dict[str, Any]]]:
         """
         Save conversation transcript to agent's transcripts directory.
         
@@ -121,10 +125,11 @@ class AgentDataStorage:
             metadata: Optional additional metadata
 
         Returns:
-            Saved filepath or None on error
+            (saved filepath, the transcript dict that was written),
+            or (None, None) on error
         """
         if not self.cfg.ENABLE_DATA_STORAGE:
-            return None
+            return None, None
 
         try:
             self.ensure_directories()
@@ -147,21 +152,90 @@ class AgentDataStorage:
             with open(filepath, "w", encoding="utf-8") as f:
                 json.dump(transcript_data, f, indent=2, ensure_ascii=False)
 
-            print(f"[{call_id}] 📄 Transcript saved: {filepath} ({len(consolidated)} turns from {len(conversation)} entries)")
-            return str(filepath)
+            log.info(
+                "[%s] 📄 Transcript saved: %s (%s turns from %s entries)",
+                call_id, filepath, len(consolidated), len(conversation),
+            )
+            return str(filepath), transcript_data
 
         except Exception as e:
-            print(f"[{call_id}] ❌ Failed to save transcript: {e}")
-            return None
+            log.error("[%s] ❌ Failed to save transcript: %s", call_id, e)
+            return None, None
+
+    def _spool_path(self, call_id: str, spool_id: str) -> Path:
+        return self.transcripts_dir / f"call_{call_id}_{spool_id}_live.jsonl"
+
+    def append_transcript_spool(
+        self,
+        call_id: str,
+        spool_id: str,
+        entries: List[Dict[str, Any]],
+    ) -> bool:
+        """
+        Append raw transcription entries to the call's live JSONL spool.
+
+        Used during long calls so older entries don't have to stay in memory;
+        `read_transcript_spool` returns them at end of call. `spool_id` is
+        unique per session, so calls sharing a call_id (e.g. "UNKNOWN")
+        never share a spool.
+
+        Returns:
+            True if the entries were written
+        """
+        if not self.cfg.ENABLE_DATA_STORAGE or not entries:
+            return False
 
-    def load_transcript(self, filepath: str) -> Optional[Dict[str, Any]]:
-        """Load a saved transcript JSON file."""
         try:
-            with open(filepath, "r", encoding="utf-8") as f:
-                return json.load(f)
+            self.ensure_directories()
+            lines = "".join(fast_json.dumps(e) + "\n" for e in entries)
+            with open(self._spool_path(call_id, spool_id), "a", encoding="utf-8") as f:
+                f.write(lines)
+            return True
         except Exception as e:
-            print(f"❌ Failed to load transcript: {e}")
-            return None
+            log.error("[%s] ❌ Failed to spool transcript entries: %s", call_id, e)
+            return False
+
+    def read_transcript_spool(
+        self, call_id: str, spool_id: str, remove: bool = True
+    ) -> List[Dict[str, Any]]:
+        """
+        Load spooled transcription entries (oldest first), deleting the spool by default.
+
+        A line that doesn't parse (e.g. a torn final write) is logged and
+        skipped so the rest of the transcript still comes back.
+        """
+        path = self._spool_path(call_id, spool_id)
+        entries: List[Dict[str, Any]] = []
+        try:
+            with open(path, "r", encoding="utf-8", errors="replace") as f:
+                for line_no, line in enumerate(f, 1):
+                    if not line.strip():
+                        continue
+                    try:
+                        entries.append(fast_json.loads(line))
+                    except ValueError as e:
+                        log.warning(
+                            "[%s] ⚠️ Skipping bad transcript spool line %s in %s: %s",
+                            call_id, line_no, path, e,
+                        )
+            if remove:
+                path.unlink()
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            log.error("[%s] ❌ Failed to read transcript spool %s: %s", call_id, path, e)
+        return entries
+
+    def discard_transcript_spool(self, call_id: str, spool_id: str) -> None:
+        """Delete a spool that was never read back (the call's save bailed out early)."""
+        path = self._spool_path(call_id, spool_id)
+        try:
+            path.unlink()
+            log.warning("[%s] ⚠️ Discarded unread transcript spool: %s", call_id, path)
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            log.error("[%s] ❌ Failed to remove transcript spool %s: %s", call_id, path, e)
 
     def save_si_payload(
         self,
@@ -189,11 +263,11 @@ class AgentDataStorage:
             with open(filepath, "w", encoding="utf-8") as f:
                 json.dump(payload, f, indent=2, ensure_ascii=False)
 
-            print(f"[{call_id}] 📤 SI payload saved: {filepath}")
+            log.info("[%s] 📤 SI payload saved: %s", call_id, filepath)
             return filename
 
         except Exception as e:
-            print(f"[{call_id}] ❌ Failed to save SI payload: {e}")
+            log.error("[%s] ❌ Failed to save SI payload: %s", call_id, e)
             return None
 
     def save_waybeo_payload(
@@ -222,9 +296,9 @@ class AgentDataStorage:
             with open(filepath, "w", encoding="utf-8") as f:
                 json.dump(payload, f, indent=2, ensure_ascii=False)
 
-            print(f"[{call_id}] 📞 Waybeo payload saved: {filepath}")
+            log.info("[%s] 📞 Waybeo payload saved: %s", call_id, filepath)
             return filename
 
         except Exception as e:
-            print(f"[{call_id}] ❌ Failed to save Waybeo payload: {e}")
+            log.error("[%s] ❌ Failed to save Waybeo payload: %s", call_id, e)
             return None
@@ -0,0 +1,54 @@
+"""
+JSON encode/decode for the per-frame WebSocket paths (Waybeo media events,
+Gemini Live messages), the end-of-call HTTP bodies (SI/Waybeo webhooks,
+Admin UI pushes, Waybeo call-control API) and the JSONL transcript spool.
+
+Uses orjson when it is installed and falls back to the stdlib json module
+otherwise. `dumps` always returns `str`: websockets sends `bytes` as a binary
+frame, and both Waybeo and Gemini expect JSON text frames.
+
+With orjson the output differs from `json.dumps` defaults: it is compact,
+non-ASCII text is written as raw UTF-8 instead of \\uXXXX escapes, and a dict
+with non-str keys raises TypeError instead of having its keys coerced.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Union
+
+import numpy as np
+
+try:
+    import orjson
+except ImportError:  # optional: stdlib json is used instead
+    orjson = None
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so one except clause covers both
+JSONDecodeError = json.JSONDecodeError
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any) -> str:
+    if orjson is not None:
+        return orjson.dumps(obj).decode("utf-8")
+    return json.dumps(obj)
+
+
+def dumps_samples(samples: np.ndarray) -> str:
+    """
+    Encode a 1-D int16 sample array as a JSON list (e.g. `[12,-40,7]`).
+
+    With orjson the array is serialized directly (OPT_SERIALIZE_NUMPY),
+    skipping the per-sample Python ints that `ndarray.tolist()` creates.
+    """
+    if orjson is not None:
+        return orjson.dumps(
+            np.ascontiguousarray(samples), option=orjson.OPT_SERIALIZE_NUMPY
+        ).decode("utf-8")
+    return json.dumps(samples.tolist())
@@ -9,10 +9,13 @@ from __future__ import annotations
 
 import json
 import asyncio
+import logging
 from typing import Any, Dict, List, Optional
 from urllib.request import Request, urlopen
 from urllib.error import HTTPError, URLError
 
+log = logging.getLogger("telephony.gemini_extractor")
+
 
 EXTRACTION_PROMPT = """You are an AI assistant that extracts structured data from voice call transcripts.
 
@@ -102,7 +105,7 @@ class GeminiExtractor:
             Dictionary with extracted data and confidence scores
         """
         if not self.api_key:
-            print("⚠️ GEMINI_API_KEY not configured, returning empty extraction")
+            log.warning("⚠️ GEMINI_API_KEY not configured, returning empty extraction")
             return self._empty_result("No API key configured")
 
         transcript_text = self._format_transcript(conversation)
@@ -121,7 +124,7 @@ class GeminiExtractor:
             )
             return result
         except Exception as e:
-            print(f"❌ Gemini extraction error: {e}")
+            log.error("❌ Gemini extraction error: %s", e)
             return self._empty_result(f"API error: {str(e)}")
 
     def _call_gemini_api(self, prompt: str) -> Dict[str, Any]:
@@ -178,13 +181,13 @@ class GeminiExtractor:
 
         except HTTPError as e:
             error_body = e.read().decode("utf-8") if e.fp else ""
-            print(f"❌ Gemini API HTTP error {e.code}: {error_body[:200]}")
+            log.error("❌ Gemini API HTTP error %s: %s", e.code, error_body[:200])
             return self._empty_result(f"HTTP {e.code}")
         except URLError as e:
-            print(f"❌ Gemini API URL error: {e.reason}")
+            log.error("❌ Gemini API URL error: %s", e.reason)
             return self._empty_result(f"URL error: {e.reason}")
         except json.JSONDecodeError as e:
-            print(f"❌ Failed to parse Gemini response as JSON: {e}")
+            log.error("❌ Failed to parse Gemini response as JSON: %s", e)
             return self._empty_result("JSON parse error")
 
     async def generate_summary_and_sentiment(
@@ -201,7 +204,7 @@ class GeminiExtractor:
             Dictionary with summary, sentiment, and sentimentScore
         """
         if not self.api_key:
-            print("⚠️ GEMINI_API_KEY not configured, skipping summary generation")
+            log.warning("⚠️ GEMINI_API_KEY not configured, skipping summary generation")
             return {"summary": None, "sentiment": None, "sentimentScore": None}
 
         transcript_text = self._format_transcript(conversation)
@@ -232,7 +235,7 @@ Respond ONLY with valid JSON (no markdown, no backticks):
             )
             return result
         except Exception as e:
-            print(f"❌ Summary generation error: {e}")
+            log.error("❌ Summary generation error: %s", e)
             return {"summary": None, "sentiment": None, "sentimentScore": None}
 
     def _call_gemini_summary(self, prompt: str) -> Dict[str, Any]:
@@ -294,10 +297,10 @@ Respond ONLY with valid JSON (no markdown, no backticks):
 
         except HTTPError as e:
             error_body = e.read().decode("utf-8") if e.fp else ""
-            print(f"❌ Gemini summary API error {e.code}: {error_body[:200]}")
+            log.error("❌ Gemini summary API error %s: %s", e.code, error_body[:200])
             return {"summary": None, "sentiment": None, "sentimentScore": None}
         except (URLError, json.JSONDecodeError) as e:
-            print(f"❌ Gemini summary error: {e}")
+            log.error("❌ Gemini summary error: %s", e)
             return {"summary": None, "sentiment": None, "sentimentScore": None}
 
     def _empty_result(self, reason: str) -> Dict[str, Any]:
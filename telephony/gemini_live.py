@@ -8,10 +8,12 @@ implemented for asyncio Python websockets.
 from __future__ import annotations
 
 import asyncio
-import json
+import collections
+import logging
 import ssl
+import time
 from dataclasses import dataclass
-from typing import AsyncIterator, Optional
+from typing import AsyncIterator, Deque, Optional, Set, Tuple
 
 import certifi
 import google.auth
@@ -19,6 +21,10 @@ from google.auth.transport.requests import Request
 import websockets
 from websockets.exceptions import ConnectionClosed
 
+import fast_json
+
+log = logging.getLogger("telephony.gemini_live")
+
 
 @dataclass(frozen=True)
 class GeminiSessionConfig:
@@ -120,33 +126,136 @@ Do NOT call this function:
         }
     ]
 }
+
+# realtime_input audio frame split around the base64 payload
+_AUDIO_FRAME_PREFIX = '{"realtime_input":{"media_chunks":[{"mime_type":"audio/pcm","data":"'
+_AUDIO_FRAME_SUFFIX = '"}]}}'
     
 
 
+# Application-default credentials, loaded once and refreshed only when the
+# token expires. Loading and refreshing are blocking HTTPS calls, so both run
+# in a worker thread; the lock keeps concurrent dials to one refresh.
+_credentials = None
+_credentials_lock = asyncio.Lock()
+
+
+async def _access_token() -> str:
+    global _credentials
+    async with _credentials_lock:
+        if _credentials is None:
+            _credentials, _ = await asyncio.to_thread(google.auth.default)
+        if not _credentials.valid:
+            await asyncio.to_thread(_credentials.refresh, Request())
+        return _credentials.token
+
+
+async def dial(service_url: str) -> websockets.WebSocketClientProtocol:
+    """Open an authenticated Gemini Live websocket (TCP + TLS + upgrade, no setup sent)."""
+    token = await _access_token()
+    headers = {
+        "Content-Type": "application/json",
+        "Authorization": f"Bearer {token}",
+    }
+    ssl_context = ssl.create_default_context(cafile=certifi.where())
+
+    # Use extra_headers for broad compatibility with websockets versions.
+    return await websockets.connect(service_url, extra_headers=headers, ssl=ssl_context)
+
+
+class GeminiConnectionPool:
+    """
+    A few pre-dialed Gemini Live websockets, so a new call can skip the
+    TCP/TLS/upgrade handshake.
+
+    Sockets are dialed before the caller's agent (and so the setup message)
+    is known; the session sends setup on the socket it takes. Sockets idle
+    longer than `max_idle_sec` are closed and redialed rather than handed out,
+    so a call never gets one the server is about to drop.
+    """
+
+    def __init__(self, service_url: str, size: int, max_idle_sec: float = 60.0):
+        self.service_url = service_url
+        self.size = size
+        self.max_idle_sec = max_idle_sec
+        self._idle: Deque[Tuple[float, websockets.WebSocketClientProtocol]] = collections.deque()
+        self._dialing: Set[asyncio.Task] = set()
+        self._recycler: Optional[asyncio.Task] = None
+        self._closed = False
+
+    def start(self) -> None:
+        for _ in range(self.size):
+            self._refill()
+        self._recycler = asyncio.create_task(self._recycle_stale())
+
+    def _refill(self) -> None:
+        if self._closed:
+            return
+        task = asyncio.create_task(self._dial_one())
+        self._dialing.add(task)
+        task.add_done_callback(self._dialing.discard)
+
+    async def _dial_one(self) -> None:
+        try:
+            ws = await dial(self.service_url)
+        except Exception as e:
+            log.warning("⚠️ Gemini warm pool dial failed: %s", e)
+            # Back off before retrying so an outage doesn't become a dial loop
+            await asyncio.sleep(5.0)
+            self._refill()
+            return
+        if self._closed:
+            await ws.close()
+            return
+        self._idle.append((time.monotonic(), ws))
+
+    def take(self) -> Optional[websockets.WebSocketClientProtocol]:
+        """A fresh pre-dialed socket, or None if none is ready (caller dials itself)."""
+        now = time.monotonic()
+        while self._idle:
+            dialed_at, ws = self._idle.popleft()
+            self._refill()
+            if not ws.closed and now - dialed_at < self.max_idle_sec:
+                return ws
+            asyncio.create_task(ws.close())
+        return None
+
+    async def _recycle_stale(self) -> None:
+        """Periodically close and redial idle sockets that are past max_idle_sec."""
+        while True:
+            await asyncio.sleep(self.max_idle_sec / 2)
+            now = time.monotonic()
+            # Oldest sockets are at the left
+            while self._idle and (
+                self._idle[0][1].closed or now - self._idle[0][0] >= self.max_idle_sec
+            ):
+                _, ws = self._idle.popleft()
+                self._refill()
+                await ws.close()
+
+    async def close(self) -> None:
+        self._closed = True
+        if self._recycler is not None:
+            self._recycler.cancel()
+        for task in list(self._dialing):
+            task.cancel()
+        while self._idle:
+            _, ws = self._idle.popleft()
+            await ws.close()
+
+
 class GeminiLiveSession:
     def __init__(self, cfg: GeminiSessionConfig):
         self.cfg = cfg
         self._ws: Optional[websockets.WebSocketClientProtocol] = None
 
-    @staticmethod
-    def _generate_access_token() -> str:
-        creds, _ = google.auth.default()
-        if not creds.valid:
-            creds.refresh(Request())
-        return creds.token
-
-    async def connect(self) -> None:
-        token = self._generate_access_token()
-        headers = {
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {token}",
-        }
-        ssl_context = ssl.create_default_context(cafile=certifi.where())
-
-        # Use extra_headers for broad compatibility with websockets versions.
-        self._ws = await websockets.connect(
-            self.cfg.service_url, extra_headers=headers, ssl=ssl_context
-        )
+    async def connect(self, ws: Optional[websockets.WebSocketClientProtocol] = None) -> None:
+        """
+        Open the session and send setup. `ws` is an already-dialed socket
+        (e.g. from GeminiConnectionPool.take()); without one a new socket is dialed.
+        """
+        pooled = ws is not None
+        self._ws = ws if pooled else await dial(self.cfg.service_url)
 
         # Send setup message (log it for debugging)
         setup_msg = {
@@ -183,22 +292,30 @@ class GeminiLiveSession:
         if self.cfg.enable_call_control:
             setup_msg["setup"]["tools"] = [CALL_CONTROL_FUNCTIONS]
 
-        await self.send_json(setup_msg)
+        try:
+            await self.send_json(setup_msg)
+        except ConnectionClosed:
+            if not pooled:
+                raise
+            # The server dropped the idle pooled socket: redial once and resend
+            log.warning("⚠️ Pooled Gemini socket was closed; redialing")
+            self._ws = await dial(self.cfg.service_url)
+            await self.send_json(setup_msg)
         
         # Wait for setupComplete to confirm Gemini accepted the configuration
         try:
             raw = await asyncio.wait_for(self._ws.recv(), timeout=10.0)
-            resp = json.loads(raw)
+            resp = fast_json.loads(raw)
             if resp.get("setupComplete"):
-                print("🏁 Gemini setupComplete received")
+                log.info("🏁 Gemini setupComplete received")
             else:
-                print(f"⚠️ Gemini first message was NOT setupComplete: {list(resp.keys())}")
+                log.warning("⚠️ Gemini first message was NOT setupComplete: %s", list(resp.keys()))
                 # Still usable - push message back? No, just log it.
                 # The messages() iterator will handle subsequent messages.
         except asyncio.TimeoutError:
-            print("❌ Gemini setup timed out (10s) - no setupComplete received")
+            log.error("❌ Gemini setup timed out (10s) - no setupComplete received")
         except Exception as e:
-            print(f"❌ Gemini setup error: {e}")
+            log.error("❌ Gemini setup error: %s", e)
 
     async def close(self) -> None:
         if self._ws is not None and not self._ws.closed:
@@ -207,17 +324,15 @@ class GeminiLiveSession:
     async def send_json(self, msg: dict) -> None:
         if not self._ws:
             raise RuntimeError("GeminiLiveSession not connected")
-        await self._ws.send(json.dumps(msg))
+        await self._ws.send(fast_json.dumps(msg))
 
     async def send_audio_b64_pcm16(self, audio_b64: str) -> None:
         # Matches browser demo: mime_type "audio/pcm"
-        await self.send_json(
-            {
-                "realtime_input": {
-                    "media_chunks": [{"mime_type": "audio/pcm", "data": audio_b64}]
-                }
-            }
-        )
+        # Base64 never needs JSON escaping, so the frame is the constant
+        # envelope around the payload rather than a dict serialized per chunk.
+        if not self._ws:
+            raise RuntimeError("GeminiLiveSession not connected")
+        await self._ws.send(_AUDIO_FRAME_PREFIX + audio_b64 + _AUDIO_FRAME_SUFFIX)
 
     async def trigger_greeting(self) -> None:
         """
@@ -301,9 +416,9 @@ class GeminiLiveSession:
             raise RuntimeError("GeminiLiveSession not connected")
         try:
             async for raw in self._ws:
-                yield json.loads(raw)
+                yield fast_json.loads(raw)
         except ConnectionClosed as e:
-            print(f"⚠️ Gemini WS closed: code={e.code}, reason={e.reason}")
+            log.warning("⚠️ Gemini WS closed: code=%s, reason=%s", e.code, e.reason)
             return
 
 
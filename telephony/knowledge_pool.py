@@ -9,9 +9,12 @@ for difficult-to-capture terms.
 import urllib.request
 import urllib.error
 import json
+import logging
 from typing import Dict, List, Optional, Any
 from datetime import datetime, timedelta
 
+log = logging.getLogger("telephony.knowledge_pool")
+
 
 class KnowledgePool:
     """Manages access to human-labeled knowledge pool for improved accuracy."""
@@ -59,13 +62,16 @@ class KnowledgePool:
                     data = json.loads(resp.read().decode("utf-8"))
                     self._cache = data
                     self._cache_timestamp = datetime.now()
-                    print(f"[KnowledgePool] Fetched {data.get('totalCount', 0)} corrections for {self.agent_slug}")
+                    log.info(
+                        "[KnowledgePool] Fetched %s corrections for %s",
+                        data.get('totalCount', 0), self.agent_slug,
+                    )
                     return data
                 else:
-                    print(f"[KnowledgePool] Failed to fetch: HTTP {resp.status}")
+                    log.warning("[KnowledgePool] Failed to fetch: HTTP %s", resp.status)
                     return {"knowledgePool": [], "groupedByField": {}, "totalCount": 0}
         except Exception as e:
-            print(f"[KnowledgePool] Error fetching knowledge: {e}")
+            log.warning("[KnowledgePool] Error fetching knowledge: %s", e)
             return {"knowledgePool": [], "groupedByField": {}, "totalCount": 0}
     
     def get_field_corrections(self, field_name: str) -> List[Dict[str, Any]]:
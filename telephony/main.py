@@ -19,10 +19,15 @@ Multi-agent support:
 from __future__ import annotations
 
 import asyncio
-import json
+import concurrent.futures
+import logging
+import logging.handlers
 import os
+import queue
 import re
+import sys
 import time
+import uuid
 from dataclasses import dataclass, field
 from datetime import datetime, timezone, timedelta
 
@@ -33,20 +38,37 @@ def _now_ist() -> datetime:
     """Get current time in IST."""
     return datetime.now(IST)
 
+# (epoch second, formatted string) — log timestamps only change once a second
+_ist_str_cache: tuple = (0, "")
+
+
 def _ist_str() -> str:
-    """Get IST timestamp string for logs."""
-    return datetime.now(IST).strftime("%Y-%m-%d %H:%M:%S IST")
+    """Get IST timestamp string for logs (formatted at most once per second)."""
+    global _ist_str_cache
+    now = int(time.time())
+    if now != _ist_str_cache[0]:
+        _ist_str_cache = (now, datetime.fromtimestamp(now, IST).strftime("%Y-%m-%d %H:%M:%S IST"))
+    return _ist_str_cache[1]
 from typing import Any, Dict, List, Optional
-from urllib.parse import urlparse, parse_qs
+from urllib.parse import unquote_plus
 
 import aiohttp
 import aiohttp.web
+import numpy as np
 import websockets
 from websockets.exceptions import ConnectionClosed
 
+try:
+    import uvloop
+except ImportError:  # optional: the stock asyncio event loop is used instead
+    uvloop = None
+
 from config import Config
-from audio_processor import AudioProcessor, AudioRates
-from gemini_live import GeminiLiveSession, GeminiSessionConfig
+from audio_processor import AudioProcessor, AudioRates, get_audio_processor
+from audio_buffer import PCMRingBuffer
+import fast_json
+from knowledge_pool import KnowledgePool
+from gemini_live import GeminiConnectionPool, GeminiLiveSession, GeminiSessionConfig
 from data_storage import AgentDataStorage
 from payload_builder import SIPayloadBuilder
 from payload_template_renderer import render_payload_template
@@ -57,18 +79,32 @@ from gemini_extractor import (
     build_extracted_map,
 )
 
+# Runtime output (per-call events, transcript fragments, barge-in, debug
+# traces) goes through this logger. `_setup_logging` routes it via a queue to
+# a background thread so the stdout write never blocks the event loop.
+log = logging.getLogger("telephony")
+
+
+DEFAULT_HANGUP_REASON = "Call completed"
+
 
-@dataclass
+@dataclass(slots=True)
 class TelephonySession:
     ucid: str
     agent: str
     client_ws: websockets.WebSocketServerProtocol
     gemini: GeminiLiveSession
-    input_buffer: list[int]
-    output_buffer: list[int]
+    input_buffer: bytearray  # Caller audio (int16 PCM bytes) not yet sent to Gemini
+    output_buffer: PCMRingBuffer  # Playback queue drained by _audio_sender
+    audio_ready: asyncio.Event = field(default_factory=asyncio.Event)  # Set when a full chunk is queued
+    playback_idle: asyncio.Event = field(default_factory=asyncio.Event)  # Set while the sender has < 1 chunk
+    output_epoch: int = 0  # Bumped on each barge-in clear of output_buffer
     closed: bool = False
     # Transcript capture
-    conversation: List[Dict[str, Any]] = field(default_factory=list)
+    conversation: List[Dict[str, Any]] = field(default_factory=list)  # Recent entries only
+    spooled_entries: int = 0  # Older entries moved to the on-disk transcript spool
+    spool_id: str = field(default_factory=lambda: uuid.uuid4().hex)  # Per-session spool file key
+    spool_write: Optional[asyncio.Future] = None  # In-flight spool append, awaited at save time
     start_time: Optional[datetime] = None
     call_start_time: float = field(default_factory=time.time)  # For safeguard timing
     customer_number: Optional[str] = None
@@ -88,9 +124,10 @@ class TelephonySession:
     transfer_question_asked_at: Optional[float] = None
     transfer_question_answered: bool = False
     last_transfer_answer_text: Optional[str] = None
-    # Accumulates agent text within a single turn (reset at turnComplete)
-    # Needed because Gemini sends transcription in small chunks
-    current_turn_agent_text: str = ""
+    # Agent transcription fragments within a single turn (reset at turnComplete).
+    # Needed because Gemini sends transcription in small chunks; kept as a
+    # list and joined once per turn (see _turn_text)
+    current_turn_agent_parts: List[str] = field(default_factory=list)
     # Call control event tracking (for Admin UI)
     call_control_event: Optional[Dict[str, Any]] = None
     waybeo_payload: Optional[Dict[str, Any]] = None
@@ -99,8 +136,39 @@ class TelephonySession:
     waybeo_webhook_response: Optional[Dict[str, Any]] = None
     # Language enforcement state
     language_state: str = "hindi"            # Current expected language (hindi or english)
-    current_turn_user_text: str = ""         # Accumulated user text for current turn
+    current_turn_user_parts: List[str] = field(default_factory=list)  # User fragments for current turn
     language_correction_pending: bool = False # Set after mismatch injection
+    # Pre-encoded outbound frames (built once the real UCID is known)
+    clear_payload: str = ""
+    hangup_payload: str = ""  # WS hangup event for the default "Call completed" reason
+    media_prefix: str = ""
+    media_suffix: str = ""
+
+
+def _encode_session_payloads(session: TelephonySession, cfg: Config) -> None:
+    """
+    Pre-encode the session-constant parts of outbound telephony frames.
+
+    The clear event depends only on the UCID, and a media event differs per
+    chunk only in its samples and frame count, so both are serialized once
+    here instead of per send. Frames stay `str` so websockets keeps sending
+    them as text frames (Waybeo expects JSON text, not binary).
+    """
+    session.clear_payload = fast_json.dumps({"event": "clear", "ucid": session.ucid})
+    session.hangup_payload = fast_json.dumps(
+        {"event": "hangup", "ucid": session.ucid, "reason": DEFAULT_HANGUP_REASON}
+    )
+    head = fast_json.dumps({"event": "media", "type": "media", "ucid": session.ucid, "data": {"samples": []}})
+    session.media_prefix = head[: -len("]}}")]
+    session.media_suffix = (
+        '],"bitsPerSample":16,"sampleRate":%d,"channelCount":1,'
+        '"numberOfFrames":%%d,"type":"data"}}' % cfg.TELEPHONY_SR
+    )
+
+
+def _encode_media_frame(session: TelephonySession, samples: np.ndarray) -> str:
+    """Build a Waybeo media event from the pre-encoded session template."""
+    return session.media_prefix + fast_json.dumps_samples(samples)[1:-1] + session.media_suffix % samples.size
 
 
 # ────────────────────────────────────────────────────────────────────────────
@@ -116,18 +184,23 @@ class TelephonySession:
 # ────────────────────────────────────────────────────────────────────────────
 
 
-def _extract_function_call(msg: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+def _model_parts(server_content: Optional[Dict[str, Any]]) -> Optional[List[Any]]:
+    """serverContent.modelTurn.parts, or None (no empty {} / [] defaults allocated)."""
+    model_turn = server_content.get("modelTurn") if server_content else None
+    return model_turn.get("parts") if model_turn else None
+
+
+def _extract_function_call(
+    msg: Dict[str, Any], parts: Optional[List[Any]]
+) -> Optional[Dict[str, Any]]:
     """
     Extract function call from Gemini Live 2.5 message.
     
     Gemini calls transfer_call() or end_call() based on conversation.
     Returns dict with name, args, and id (for sending function responses back).
+    `parts` is the message's _model_parts(), drilled out once by the reader.
     """
-    server_content = msg.get("serverContent", {})
-    model_turn = server_content.get("modelTurn", {})
-    parts = model_turn.get("parts", [])
-    
-    for part in parts:
+    for part in parts or ():
         if isinstance(part, dict) and "functionCall" in part:
             func_call = part["functionCall"]
             return {
@@ -150,12 +223,49 @@ def _extract_function_call(msg: Dict[str, Any]) -> Optional[Dict[str, Any]]:
     return None
 
 
+_WS_RE = re.compile(r"\s+")
+
+
+def _alternation(phrases) -> str:
+    """
+    Regex alternation of phrases factored by common prefix (a character
+    trie), e.g. ["yes", "yeah", "yep"] → "ye(?:ah|p|s)". At each position the
+    engine dispatches on one character instead of retrying every phrase.
+    """
+    trie: Dict[str, dict] = {}
+    for phrase in phrases:
+        node = trie
+        for ch in phrase:
+            node = node.setdefault(ch, {})
+        node[""] = {}  # end-of-phrase marker
+
+    def emit(node: Dict[str, dict]) -> str:
+        branches = [re.escape(ch) + emit(child) for ch, child in sorted(node.items()) if ch]
+        if not branches:
+            return ""
+        if len(branches) == 1 and "" not in node:
+            return branches[0]
+        return "(?:%s)%s" % ("|".join(branches), "?" if "" in node else "")
+
+    return emit(trie)
+
+
+def _phrase_pattern(phrases) -> "re.Pattern[str]":
+    """Compile a phrase list into one alternation so a single C-level scan finds any of them."""
+    return re.compile(_alternation(phrases))
+
+
+def _turn_text(parts: List[str]) -> str:
+    """Join a turn's transcription fragments (space-separated, stripped)."""
+    return " ".join(parts).strip()
+
+
 def _normalize_text(text: Optional[str]) -> str:
     """Normalize text for pattern matching: lowercase, strip, collapse whitespace."""
     if not text:
         return ""
     # Collapse multiple spaces into single space (handles accumulated chunks with double spaces)
-    return re.sub(r'\s+', ' ', text.strip().lower())
+    return _WS_RE.sub(" ", text.strip().lower())
 
 
 def _is_affirmative(text: Optional[str]) -> bool:
@@ -189,42 +299,57 @@ def _is_negative(text: Optional[str]) -> bool:
     }
 
 
+_TRANSFER_REQUEST_RE = _phrase_pattern([
+    "talk to a person",
+    "talk to someone",
+    "talk to sales",
+    "talk to agent",
+    "talk to dealer",
+    "connect me to",
+    "connect to dealer",
+    "connect to sales",
+    "speak to",
+    "kisi se baat",
+    "agent se baat",
+    "dealer se baat",
+    "sales team se baat",
+    "insaan se baat",
+    "baat karao",
+    "baat karni hai",
+])
+
+
 def _is_explicit_transfer_request(text: Optional[str]) -> bool:
     normalized = _normalize_text(text)
     if not normalized:
         return False
-    transfer_phrases = [
-        "talk to a person",
-        "talk to someone",
-        "talk to sales",
-        "talk to agent",
-        "talk to dealer",
-        "connect me to",
-        "connect to dealer",
-        "connect to sales",
-        "speak to",
-        "kisi se baat",
-        "agent se baat",
-        "dealer se baat",
-        "sales team se baat",
-        "insaan se baat",
-        "baat karao",
-        "baat karni hai",
-    ]
-    return any(phrase in normalized for phrase in transfer_phrases)
+    return _TRANSFER_REQUEST_RE.search(normalized) is not None
 
 
 def _is_transfer_question(text: Optional[str]) -> bool:
-    normalized = _normalize_text(text)
-    if not normalized:
-        return False
-    return (
-        "sales team" in normalized
-        or "speak with our sales" in normalized
-        or "sales team se baat" in normalized
-        or "sales team se baat karna chahenge" in normalized
-        or "sales team se baat karna chahenge?" in normalized
-    )
+    return _is_transfer_question_norm(_normalize_text(text))
+
+
+def _is_transfer_question_norm(normalized: str) -> bool:
+    """_is_transfer_question for text already passed through _normalize_text."""
+    # "sales team" also covers "sales team se baat (karna chahenge?)"
+    return "sales team" in normalized or "speak with our sales" in normalized
+
+
+_GOODBYE_RE = _phrase_pattern([
+    "have a great day",
+    "have a good day",
+    "have a nice day",
+    "din shubh ho",
+    "aapka din shubh",
+    "namaste aur dhanyawad",
+    "call karne ke liye dhanyawad",
+    "thank you for calling",
+    "thanks for calling",
+    "goodbye",
+    "good bye",
+    "alvida",
+])
 
 
 def _is_goodbye_message(text: Optional[str]) -> bool:
@@ -237,24 +362,12 @@ def _is_goodbye_message(text: Optional[str]) -> bool:
     Only matches phrases that appear at call endings — NOT generic
     "thank you" that could appear mid-conversation.
     """
-    if not text:
-        return False
-    normalized = text.lower().strip()
-    goodbye_phrases = [
-        "have a great day",
-        "have a good day",
-        "have a nice day",
-        "din shubh ho",
-        "aapka din shubh",
-        "namaste aur dhanyawad",
-        "call karne ke liye dhanyawad",
-        "thank you for calling",
-        "thanks for calling",
-        "goodbye",
-        "good bye",
-        "alvida",
-    ]
-    return any(phrase in normalized for phrase in goodbye_phrases)
+    return _is_goodbye_norm(_normalize_text(text))
+
+
+def _is_goodbye_norm(normalized: str) -> bool:
+    """_is_goodbye_message for text already passed through _normalize_text."""
+    return _GOODBYE_RE.search(normalized) is not None
 
 
 # ────────────────────────────────────────────────────────────────────────────
@@ -265,7 +378,10 @@ def _is_goodbye_message(text: Optional[str]) -> bool:
 # This runtime layer detects language mismatches and injects corrections.
 # ────────────────────────────────────────────────────────────────────────────
 
-# Common Hindi words in Latin script (Romanized Hindi)
+# Common Hindi words in Latin script (Romanized Hindi).
+# Kept as a set rather than a compiled alternation: the detectors need the
+# meaningful-word total anyway, so they already split, and per-word set
+# lookups on that split beat a second findall pass over the text.
 _HINDI_WORDS = frozenset({
     "mein", "hai", "hain", "ho", "hoon", "hun", "tha", "thi",
     "kya", "aur", "nahi", "haan", "ji", "naa",
@@ -292,6 +408,47 @@ _HINDI_WORDS = frozenset({
 })
 
 
+# Data-response vocabularies, each compiled into a single pattern (see _is_data_response)
+# Yes/No / affirmative / negative openers, as a whole reply or followed by " " / ","
+_YES_NO_START_RE = re.compile(
+    r"(?:%s)(?:[ ,]|\Z)" % _alternation((
+        "yes", "no", "yeah", "yep", "nah", "ok", "okay", "sure",
+        "haan", "nahi", "nahin", "ji", "bilkul", "theek", "hmm",
+        "accha", "right",
+    ))
+)
+# Name-giving phrases (substring match)
+_NAME_PHRASE_RE = _phrase_pattern((
+    "my name is", "my name's", "i am ", "i'm ", "this is ",
+    "naam ", "mera naam", "it's ", "call me ",
+))
+# Date/time words and address/location indicators (whole words only, so
+# "planet" doesn't count as "lane" and "kalyan" doesn't count as "kal")
+_DATE_ADDR_RE = re.compile(r"\b(?:%s)\b" % _alternation((
+    "tomorrow", "today", "yesterday",
+    "monday", "tuesday", "wednesday", "thursday",
+    "friday", "saturday", "sunday",
+    "kal", "aaj", "parso",
+    "next week", "this week", "day after",
+    "road", "street", "nagar", "colony", "sector", "marg",
+    "lane", "avenue", "block", "phase", "floor", "flat",
+    "building", "chowk", "bazaar", "market", "pin code",
+    "pincode", "area",
+)))
+# Deletion table for digit characters (ASCII, Devanagari and other BMP scripts);
+# len(text) - len(text.translate(...)) is the digit count in one C pass
+_DIGIT_ZAP = str.maketrans("", "", "".join(c for c in map(chr, range(0x10000)) if c.isdigit()))
+
+
+# "@" or a common mail domain fragment → the text is (part of) an email address
+_EMAIL_HINT_RE = _phrase_pattern(("@", "gmail", "yahoo", "hotmail", "outlook", ".com", ".in", ".co"))
+# Punctuation stripped from word edges before classification (the agent
+# detector keeps "@"), and the Devanagari block
+_WORD_EDGE_PUNCT = ".,!?;:\"'()@"
+_AGENT_WORD_EDGE_PUNCT = ".,!?;:\"'()"
+_DEVANAGARI_RE = re.compile("[\u0900-\u097F]")
+
+
 def _is_data_response(text: str) -> bool:
     """
     Detect if text is a data-point response (name, yes/no, date/time,
@@ -304,54 +461,22 @@ def _is_data_response(text: str) -> bool:
 
     # ── 1. Yes/No / affirmative / negative responses ──
     # "yes", "yeah day after tomorrow", "no thanks", "sure why not"
-    _YES_NO_STARTS = (
-        "yes", "no", "yeah", "yep", "nah", "ok", "okay", "sure",
-        "haan", "nahi", "nahin", "ji", "bilkul", "theek", "hmm",
-        "accha", "right",
-    )
-    for prefix in _YES_NO_STARTS:
-        if tl == prefix or tl.startswith(prefix + " ") or tl.startswith(prefix + ","):
-            return True
+    if _YES_NO_START_RE.match(tl):
+        return True
 
     # ── 2. Name-giving phrases ──
     # "My name is Rohit Sharma", "I am Rohit", "naam Rohit hai"
-    _NAME_PATTERNS = (
-        "my name is", "my name's", "i am ", "i'm ", "this is ",
-        "naam ", "mera naam", "it's ", "call me ",
-    )
-    for p in _NAME_PATTERNS:
-        if p in tl:
-            return True
-
-    # ── 3. Date/time responses (test-drive scheduling) ──
-    # "day after tomorrow", "next Monday", "this Saturday"
-    _DATE_WORDS = {
-        "tomorrow", "today", "yesterday",
-        "monday", "tuesday", "wednesday", "thursday",
-        "friday", "saturday", "sunday",
-        "kal", "aaj", "parso",
-        "next week", "this week", "day after",
-    }
-    for dw in _DATE_WORDS:
-        if dw in tl:
-            return True
+    if _NAME_PHRASE_RE.search(tl):
+        return True
 
-    # ── 4. Address / location indicators ──
-    # "42 MG Road Koramangala Bangalore"
-    _ADDR_WORDS = {
-        "road", "street", "nagar", "colony", "sector", "marg",
-        "lane", "avenue", "block", "phase", "floor", "flat",
-        "building", "chowk", "bazaar", "market", "pin code",
-        "pincode", "area",
-    }
-    for aw in _ADDR_WORDS:
-        if aw in tl:
-            return True
+    # ── 3-4. Date/time responses (test-drive scheduling), address / location ──
+    # "day after tomorrow", "next Monday", "42 MG Road Koramangala Bangalore"
+    if _DATE_ADDR_RE.search(tl):
+        return True
 
     # ── 5. Phone number responses ──
     # "9876543210", "my number is 9876543210"
-    digits = sum(1 for c in tl if c.isdigit())
-    if digits >= 7:  # Likely a phone number
+    if len(tl) - len(tl.translate(_DIGIT_ZAP)) >= 7:  # 7+ digits → likely a phone number
         return True
 
     return False
@@ -374,9 +499,7 @@ def _detect_language(text: str) -> tuple:
     # ── Always Category A: emails, phone numbers, single-word items ──
     # Emails contain @ or common domain fragments — NEVER switch language for them
     text_lower = text.lower()
-    if "@" in text or any(d in text_lower for d in [
-        "gmail", "yahoo", "hotmail", "outlook", ".com", ".in", ".co"
-    ]):
+    if _EMAIL_HINT_RE.search(text_lower):
         return ("unknown", "A")
 
     # ── Always Category A: data-point responses ──
@@ -386,32 +509,36 @@ def _detect_language(text: str) -> tuple:
         return ("unknown", "A")
 
     # Check for Devanagari script → likely Hindi
-    has_devanagari = any("\u0900" <= c <= "\u097F" for c in text)
-
-    # Split into meaningful words (filter single chars & punctuation)
-    words = [w.strip(".,!?;:\"'()@") for w in text.split()]
-    meaningful = [w for w in words if len(w) > 1]
+    has_devanagari = _DEVANAGARI_RE.search(text) is not None
+
+    # One pass over the words: count meaningful ones (filter single chars &
+    # punctuation) and the Romanized Hindi words among them
+    meaningful_count = 0
+    hindi_count = 0
+    has_sentence_words = False  # Hindi word longer than 2 chars (verb-like)
+    for w in text_lower.split():
+        w = w.strip(_WORD_EDGE_PUNCT)
+        if len(w) > 1:
+            meaningful_count += 1
+            if w in _HINDI_WORDS:
+                hindi_count += 1
+                if len(w) > 2:
+                    has_sentence_words = True
 
     if has_devanagari:
         # Even with Devanagari, require 4+ meaningful words that are NOT
         # just a name/email (which may be transcribed in Devanagari).
-        if len(meaningful) < 4:
+        if meaningful_count < 4:
             return ("hindi", "A")
         # Check if it looks like a sentence (has verb-like Hindi words)
-        has_sentence_words = any(
-            w in _HINDI_WORDS
-            for w in (w.strip(".,!?;:\"'()") for w in text.split())
-            if len(w) > 2
-        )
         return ("hindi", "B") if has_sentence_words else ("hindi", "A")
 
     # All Latin script — check word count for category
-    if len(meaningful) < 4:
+    if meaningful_count < 4:
         return ("unknown", "A")  # Too short → Category A (names, models, etc.)
 
-    # Count Hindi words in Romanized text
-    hindi_count = sum(1 for w in meaningful if w.lower() in _HINDI_WORDS)
-    hindi_ratio = hindi_count / max(len(meaningful), 1)
+    # Ratio of Hindi words in Romanized text
+    hindi_ratio = hindi_count / max(meaningful_count, 1)
 
     if hindi_ratio >= 0.25 or hindi_count >= 3:
         return ("hindi", "B")
@@ -420,16 +547,23 @@ def _detect_language(text: str) -> tuple:
 
 
 def _detect_agent_language(text: str) -> str:
-    """Detect which language the agent is speaking from accumulated turn text."""
-    if not text or not text.strip():
-        return "unknown"
+    """
+    Detect which language the agent is speaking from accumulated turn text.
 
-    words = [w.strip(".,!?;:\"'()").lower() for w in text.split() if len(w.strip(".,!?;:\"'()")) > 1]
-    if not words:
+    One pass over the words: edge punctuation is stripped and each word is
+    looked up once. Accepts raw or `_normalize_text` output.
+    """
+    if not text or not text.strip():
         return "unknown"
 
-    hindi_count = sum(1 for w in words if w in _HINDI_WORDS)
-    total = len(words)
+    total = 0
+    hindi_count = 0
+    for w in text.lower().split():
+        w = w.strip(_AGENT_WORD_EDGE_PUNCT)
+        if len(w) > 1:
+            total += 1
+            if w in _HINDI_WORDS:
+                hindi_count += 1
 
     if total == 0:
         return "unknown"
@@ -444,7 +578,30 @@ def _detect_agent_language(text: str) -> str:
 # Telephony Control Events (Waybeo/Ozonetel)
 # ────────────────────────────────────────────────────────────────────────────
 
-async def _waybeo_api_command(session: TelephonySession, command: str, cfg: "Config") -> bool:
+# Process-wide HTTP client: keeps TCP/TLS connections to Waybeo alive between
+# calls so hangup/transfer don't pay a fresh handshake on the teardown path.
+_http_session: Optional[aiohttp.ClientSession] = None
+
+
+def _get_http_session() -> aiohttp.ClientSession:
+    """Return the shared aiohttp session, creating it on first use (inside the running loop)."""
+    global _http_session
+    if _http_session is None or _http_session.closed:
+        _http_session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=32, ttl_dns_cache=300, keepalive_timeout=60),
+            timeout=aiohttp.ClientTimeout(total=10),
+        )
+    return _http_session
+
+
+async def _close_http_session() -> None:
+    global _http_session
+    if _http_session is not None and not _http_session.closed:
+        await _http_session.close()
+    _http_session = None
+
+
+async def _waybeo_api_command(session: TelephonySession, command: str, cfg: "Config") -> Optional[Dict[str, Any]]:
     """
     Send a command to Waybeo via their HTTP API.
     
@@ -457,11 +614,11 @@ async def _waybeo_api_command(session: TelephonySession, command: str, cfg: "Con
         cfg: Config instance
     
     Returns:
-        True if API call succeeded
+        Parsed response body ({} if not a JSON object) on success, None on failure
     """
     if not cfg.WAYBEO_AUTH_TOKEN:
-        print(f"[{session.ucid}] ⚠️ WAYBEO_AUTH_TOKEN not configured - cannot send {command}")
-        return False
+        log.warning("[%s] ⚠️ WAYBEO_AUTH_TOKEN not configured - cannot send %s", session.ucid, command)
+        return None
     
     api_url = cfg.WAYBEO_API_URL
     payload = {
@@ -469,24 +626,31 @@ async def _waybeo_api_command(session: TelephonySession, command: str, cfg: "Con
         "callId": session.ucid,
     }
     
+    headers = {
+        "Content-Type": "application/json",
+        "Authorization": f"Bearer {cfg.WAYBEO_AUTH_TOKEN}",
+    }
     try:
-        async with aiohttp.ClientSession() as http_session:
-            headers = {
-                "Content-Type": "application/json",
-                "Authorization": f"Bearer {cfg.WAYBEO_AUTH_TOKEN}",
-            }
-            print(f"[{session.ucid}] 🔄 Waybeo API → {command} (POST {api_url})")
-            async with http_session.post(api_url, json=payload, headers=headers, timeout=aiohttp.ClientTimeout(total=10)) as resp:
-                resp_text = await resp.text()
-                if resp.status < 300:
-                    print(f"[{session.ucid}] ✅ Waybeo {command} API success: HTTP {resp.status}")
-                    return True
-                else:
-                    print(f"[{session.ucid}] ❌ Waybeo {command} API failed: HTTP {resp.status} - {resp_text[:200]}")
-                    return False
+        http_session = _get_http_session()
+        log.info("[%s] 🔄 Waybeo API → %s (POST %s)", session.ucid, command, api_url)
+        async with http_session.post(api_url, data=fast_json.dumps(payload), headers=headers) as resp:
+            resp_text = await resp.text()
+            if resp.status < 300:
+                log.info("[%s] ✅ Waybeo %s API success: HTTP %s", session.ucid, command, resp.status)
+                try:
+                    body = fast_json.loads(resp_text) if resp_text else {}
+                except ValueError:
+                    body = {}
+                return body if isinstance(body, dict) else {}
+            else:
+                log.error(
+                    "[%s] ❌ Waybeo %s API failed: HTTP %s - %s",
+                    session.ucid, command, resp.status, resp_text[:200],
+                )
+                return None
     except Exception as e:
-        print(f"[{session.ucid}] ❌ Waybeo {command} API error: {e}")
-        return False
+        log.error("[%s] ❌ Waybeo %s API error: %s", session.ucid, command, e)
+        return None
 
 
 async def send_transfer_event(session: TelephonySession, transfer_number: Optional[str], cfg: "Config") -> bool:
@@ -506,34 +670,42 @@ async def send_transfer_event(session: TelephonySession, transfer_number: Option
     """
     try:
         # Primary: Use Waybeo HTTP API (correct protocol)
-        api_success = await _waybeo_api_command(session, "transfer_call", cfg)
+        api_result = await _waybeo_api_command(session, "transfer_call", cfg)
         
-        if api_success:
-            print(f"[{_ist_str()}] [{session.ucid}] 📞 Transfer sent via Waybeo API")
+        if api_result is not None:
+            log.info("[%s] [%s] 📞 Transfer sent via Waybeo API", _ist_str(), session.ucid)
             return True
         
         # Fallback: Send WebSocket event (legacy, may not work). Requires number.
         if transfer_number:
-            print(f"[{session.ucid}] ⚠️ Waybeo API failed, trying WebSocket fallback...")
+            log.warning("[%s] ⚠️ Waybeo API failed, trying WebSocket fallback...", session.ucid)
             transfer_payload = {
                 "event": "transfer",
                 "ucid": session.ucid,
                 "phone": transfer_number,
                 "reason": "Customer requested transfer to dealer",
             }
-            await session.client_ws.send(json.dumps(transfer_payload))
-            print(f"[{session.ucid}] 📞 Transfer event sent via WebSocket → {transfer_number}")
+            await session.client_ws.send(fast_json.dumps(transfer_payload))
+            log.info("[%s] 📞 Transfer event sent via WebSocket → %s", session.ucid, transfer_number)
             return True
 
-        print(f"[{session.ucid}] ⚠️ Waybeo API failed and no transfer number configured for WS fallback")
+        log.warning(
+            "[%s] ⚠️ Waybeo API failed and no transfer number configured for WS fallback",
+            session.ucid,
+        )
         return False
     except Exception as e:
         if cfg.DEBUG:
-            print(f"[{session.ucid}] ❌ Failed to send transfer event: {e}")
+            log.debug("[%s] ❌ Failed to send transfer event: %s", session.ucid, e)
         return False
 
 
-async def send_hangup_event(session: TelephonySession, cfg: "Config", reason: str = "Call completed") -> bool:
+# After a hangup: pause before closing the media WS, and cap on the close handshake
+HANGUP_CLOSE_GUARD_SEC = 0.25
+HANGUP_CLOSE_TIMEOUT_SEC = 0.5
+
+
+async def send_hangup_event(session: TelephonySession, cfg: "Config", reason: str = DEFAULT_HANGUP_REASON) -> bool:
     """
     Send hangup command to Waybeo via HTTP API, then close WebSocket.
     
@@ -550,41 +722,52 @@ async def send_hangup_event(session: TelephonySession, cfg: "Config", reason: st
     """
     try:
         # Primary: Use Waybeo HTTP API (correct protocol)
-        api_success = await _waybeo_api_command(session, "hangup_call", cfg)
+        api_result = await _waybeo_api_command(session, "hangup_call", cfg)
         
-        if api_success:
-            print(f"[{session.ucid}] 📞 Hangup sent via Waybeo API: {reason}")
+        if api_result is not None:
+            log.info("[%s] 📞 Hangup sent via Waybeo API: %s", session.ucid, reason)
         else:
             # Fallback: Send WebSocket event (legacy)
-            print(f"[{session.ucid}] ⚠️ Waybeo API hangup failed, trying WebSocket fallback...")
+            log.warning("[%s] ⚠️ Waybeo API hangup failed, trying WebSocket fallback...", session.ucid)
             try:
-                hangup_payload = {
-                    "event": "hangup",
-                    "ucid": session.ucid,
-                    "reason": reason,
-                }
-                await session.client_ws.send(json.dumps(hangup_payload))
-                print(f"[{session.ucid}] 📞 Hangup sent via WebSocket: {reason}")
+                if reason == DEFAULT_HANGUP_REASON and session.hangup_payload:
+                    hangup_payload = session.hangup_payload
+                else:
+                    hangup_payload = fast_json.dumps({
+                        "event": "hangup",
+                        "ucid": session.ucid,
+                        "reason": reason,
+                    })
+                await session.client_ws.send(hangup_payload)
+                log.info("[%s] 📞 Hangup sent via WebSocket: %s", session.ucid, reason)
             except Exception:
                 pass
         
-        # Give Waybeo time to process the hangup command before closing WS.
-        # If we close WS immediately, Waybeo may not have finished
-        # disconnecting the phone line, and the caller stays connected.
-        await asyncio.sleep(1.0)
+        # Short guard so Waybeo has started tearing down the line before the
+        # media WS goes away (closing in the same instant can race the
+        # hangup). Skipped when the API response says the line is already down.
+        line_status = str((api_result or {}).get("status", "")).lower()
+        if line_status not in {"disconnected", "completed"}:
+            await asyncio.sleep(HANGUP_CLOSE_GUARD_SEC)
         
-        # Close the WebSocket connection as final cleanup
+        # Close the WebSocket connection as final cleanup; bounded so a peer
+        # that never answers the close handshake can't hold the call open
         try:
             if session.client_ws.open:
-                await session.client_ws.close(code=1000, reason=reason)
-                print(f"[{session.ucid}] 📞 WebSocket closed (hangup)")
+                await asyncio.wait_for(
+                    session.client_ws.close(code=1000, reason=reason),
+                    timeout=HANGUP_CLOSE_TIMEOUT_SEC,
+                )
+                log.info("[%s] 📞 WebSocket closed (hangup)", session.ucid)
+        except asyncio.TimeoutError:
+            log.warning("[%s] ⚠️ WebSocket close handshake timed out (hangup)", session.ucid)
         except Exception as close_err:
-            print(f"[{session.ucid}] ⚠️ WebSocket close error: {close_err}")
+            log.warning("[%s] ⚠️ WebSocket close error: %s", session.ucid, close_err)
         
         return True
     except Exception as e:
         if cfg.DEBUG:
-            print(f"[{session.ucid}] ❌ Failed to send hangup event: {e}")
+            log.debug("[%s] ❌ Failed to send hangup event: %s", session.ucid, e)
         return False
 
 
@@ -595,13 +778,25 @@ AGENT_PROMPTS = {
     "skoda": "skoda_prompt.txt",
 }
 
-VALID_AGENTS = set(AGENT_PROMPTS.keys())
+VALID_AGENTS = frozenset(AGENT_PROMPTS)
+
+# Absolute prompt file paths, resolved once
+_PROMPT_DIR = os.path.dirname(os.path.abspath(__file__))
+_PROMPT_PATHS = {agent: os.path.join(_PROMPT_DIR, fn) for agent, fn in AGENT_PROMPTS.items()}
+_DEFAULT_PROMPT_FILE = "kia_prompt.txt"
 
 # Admin UI API URL for fetching prompts (runs on same VM)
 ADMIN_API_BASE = os.getenv("ADMIN_API_BASE", "http://127.0.0.1:3100")
 
-# Module-level cache for agent config (includes VMN mappings, prompt, webhook endpoints)
+# Module-level cache for agent config (includes VMN mappings, prompt, webhook endpoints).
+# Entries are {"data": config-or-None, "expires_at": monotonic seconds}; failed
+# lookups are cached briefly too so a down Admin UI isn't re-hit on every call.
 _agent_config_cache: Dict[str, Dict[str, Any]] = {}
+# In-flight Admin UI fetches per agent: calls that arrive while the cache is
+# cold share one request instead of each hitting the API
+_agent_config_inflight: Dict[str, asyncio.Task] = {}
+AGENT_CONFIG_TTL_SEC = 300
+AGENT_CONFIG_MISS_TTL_SEC = 15
 
 
 def clear_agent_cache(agent: Optional[str] = None) -> Dict[str, Any]:
@@ -620,87 +815,125 @@ def clear_agent_cache(agent: Optional[str] = None) -> Dict[str, Any]:
         agent_lower = agent.lower()
         if agent_lower in _agent_config_cache:
             del _agent_config_cache[agent_lower]
-            print(f"[telephony] 🔄 Cache cleared for agent: {agent}")
+            log.info("[telephony] 🔄 Cache cleared for agent: %s", agent)
             return {"status": "success", "agent": agent, "cleared": 1}
         else:
-            print(f"[telephony] ℹ️ No cached config found for agent: {agent}")
+            log.info("[telephony] ℹ️ No cached config found for agent: %s", agent)
             return {"status": "not_found", "agent": agent, "cleared": 0}
     else:
         # Clear entire cache
         count = len(_agent_config_cache)
         _agent_config_cache.clear()
-        print(f"[telephony] 🔄 Cache cleared for all agents ({count} entries)")
+        log.info("[telephony] 🔄 Cache cleared for all agents (%s entries)", count)
         return {"status": "success", "cleared": count}
 
 
-def _fetch_agent_config_from_api(agent: str) -> Optional[Dict[str, Any]]:
+async def _fetch_agent_config_from_api(agent: str) -> Optional[Dict[str, Any]]:
     """
     Fetch full agent config from Admin UI API (includes VMN mappings).
-    Caches result for the session lifetime.
+    Caches hits for AGENT_CONFIG_TTL_SEC and misses for AGENT_CONFIG_MISS_TTL_SEC.
     Returns None if API is unavailable or agent not found.
     """
-    import urllib.request
-    import urllib.error
-    
-    # Return cached config if available
+    # Return cached config (or cached miss) if still fresh
     agent_lower = agent.lower()
-    if agent_lower in _agent_config_cache:
-        return _agent_config_cache[agent_lower]
-    
+    cached = _agent_config_cache.get(agent_lower)
+    if cached and cached["expires_at"] > time.monotonic():
+        return cached["data"]
+
+    fetch = _agent_config_inflight.get(agent_lower)
+    if fetch is None:
+        fetch = asyncio.create_task(_load_agent_config(agent_lower))
+        _agent_config_inflight[agent_lower] = fetch
+        fetch.add_done_callback(lambda _t: _agent_config_inflight.pop(agent_lower, None))
+    # Shielded: one waiting call being cancelled must not cancel the shared fetch
+    return await asyncio.shield(fetch)
+
+
+async def _load_agent_config(agent_lower: str) -> Optional[Dict[str, Any]]:
+    """Fetch one agent's config from the Admin UI API and store it in the cache."""
     url = f"{ADMIN_API_BASE}/api/telephony/prompt/{agent_lower}"
+    data: Optional[Dict[str, Any]] = None
     try:
-        req = urllib.request.Request(url, method="GET")
-        req.add_header("Accept", "application/json")
-        with urllib.request.urlopen(req, timeout=5) as resp:
+        async with _get_http_session().get(
+            url,
+            headers={"Accept": "application/json"},
+            timeout=aiohttp.ClientTimeout(total=5),
+        ) as resp:
             if resp.status == 200:
-                data = json.loads(resp.read().decode("utf-8"))
-                _agent_config_cache[agent_lower] = data
-                return data
-    except urllib.error.HTTPError as e:
-        print(f"[telephony] ⚠️ API error for {agent}: HTTP {e.code}")
+                data = await resp.json(content_type=None)
+            else:
+                log.warning("[telephony] ⚠️ API error for %s: HTTP %s", agent_lower, resp.status)
     except Exception as e:
-        print(f"[telephony] ⚠️ API unavailable for {agent}: {e}")
-    return None
+        log.warning("[telephony] ⚠️ API unavailable for %s: %s", agent_lower, e)
+
+    ttl = AGENT_CONFIG_TTL_SEC if data is not None else AGENT_CONFIG_MISS_TTL_SEC
+    _agent_config_cache[agent_lower] = {"data": data, "expires_at": time.monotonic() + ttl}
+    return data
 
 
-def _fetch_prompt_from_api(agent: str) -> Optional[str]:
+async def _fetch_prompt_from_api(agent: str) -> Optional[str]:
     """
     Fetch system instructions from Admin UI API and augment with knowledge pool.
     Returns None if API is unavailable or agent not found.
     """
-    config = _fetch_agent_config_from_api(agent)
+    config = await _fetch_agent_config_from_api(agent)
     if config:
         instructions = config.get("systemInstructions", "")
         if instructions and instructions.strip():
-            print(f"[telephony] ✅ Loaded prompt from API for agent: {agent}")
+            log.info("[telephony] ✅ Loaded prompt from API for agent: %s", agent)
             vmn_count = len(config.get("vmnMappings", {}))
             if vmn_count > 0:
-                print(f"[telephony] 📞 VMN mappings loaded: {vmn_count} entries")
+                log.info("[telephony] 📞 VMN mappings loaded: %s entries", vmn_count)
             
-            # Augment with knowledge pool if available
-            try:
-                from knowledge_pool import KnowledgePool
-                admin_url = cfg_instance.ADMIN_URL if cfg_instance else "http://localhost:3100"
-                knowledge = KnowledgePool(admin_url=admin_url, agent_slug=agent)
-                stats = knowledge.get_stats()
-                
-                if stats.get("total_corrections", 0) > 0:
-                    instructions = knowledge.augment_system_instructions(
-                        base_instructions=instructions,
-                        fields=["name", "model", "email", "test_drive"]
-                    )
-                    print(f"[telephony] 🧠 Knowledge pool augmented with {stats['total_corrections']} corrections")
-                else:
-                    print(f"[telephony] 💡 Knowledge pool empty - no corrections yet")
-            except Exception as e:
-                print(f"[telephony] ⚠️ Knowledge pool unavailable: {e}")
-                # Continue with base instructions if knowledge pool fails
-            
-            return instructions
+            # Augment with knowledge pool if available (reuse the augmented
+            # prompt for AUGMENTED_PROMPT_TTL_SEC while the base prompt is unchanged)
+            agent_lower = agent.lower()
+            cached = _augmented_prompt_cache.get(agent_lower)
+            if cached and cached[0] > time.monotonic() and cached[1] == instructions:
+                return cached[2]
+
+            # KnowledgePool uses blocking urllib — keep it off the event loop
+            loop = asyncio.get_running_loop()
+            augmented = await loop.run_in_executor(
+                None, _augment_with_knowledge_pool, agent_lower, instructions
+            )
+            _augmented_prompt_cache[agent_lower] = (
+                time.monotonic() + AUGMENTED_PROMPT_TTL_SEC, instructions, augmented
+            )
+            return augmented
     return None
 
 
-def _lookup_store_code_by_vmn(agent: str, vmn: Optional[str]) -> Optional[str]:
+# Augmented system instructions per agent: (expires_at, base_instructions, augmented)
+_augmented_prompt_cache: Dict[str, tuple] = {}
+AUGMENTED_PROMPT_TTL_SEC = 60
+# One KnowledgePool client per agent so its own fetch cache survives across calls
+_knowledge_pools: Dict[str, KnowledgePool] = {}
+
+
+def _augment_with_knowledge_pool(agent: str, instructions: str) -> str:
+    """Append knowledge-pool corrections to the base instructions (blocking)."""
+    try:
+        knowledge = _knowledge_pools.get(agent)
+        if knowledge is None:
+            knowledge = _knowledge_pools[agent] = KnowledgePool(admin_url=ADMIN_API_BASE, agent_slug=agent)
+        stats = knowledge.get_stats()
+        
+        if stats.get("total_corrections", 0) > 0:
+            instructions = knowledge.augment_system_instructions(
+                base_instructions=instructions,
+                fields=["name", "model", "email", "test_drive"]
+            )
+            log.info("[telephony] 🧠 Knowledge pool augmented with %s corrections", stats['total_corrections'])
+        else:
+            log.info("[telephony] 💡 Knowledge pool empty - no corrections yet")
+    except Exception as e:
+        log.warning("[telephony] ⚠️ Knowledge pool unavailable: %s", e)
+        # Continue with base instructions if knowledge pool fails
+    return instructions
+
+
+async def _lookup_store_code_by_vmn(agent: str, vmn: Optional[str]) -> Optional[str]:
     """
     Look up store code from VMN using the agent's VMN→StoreCode mapping.
     
@@ -714,7 +947,7 @@ def _lookup_store_code_by_vmn(agent: str, vmn: Optional[str]) -> Optional[str]:
     if not vmn:
         return None
     
-    config = _fetch_agent_config_from_api(agent)
+    config = await _fetch_agent_config_from_api(agent)
     if not config:
         return None
     
@@ -725,7 +958,7 @@ def _lookup_store_code_by_vmn(agent: str, vmn: Optional[str]) -> Optional[str]:
     # Direct lookup
     store_code = vmn_mappings.get(vmn)
     if store_code:
-        print(f"[telephony] 🏪 VMN {vmn} → Store Code: {store_code}")
+        log.info("[telephony] 🏪 VMN %s → Store Code: %s", vmn, store_code)
         return store_code
     
     # Try with/without + prefix
@@ -735,36 +968,46 @@ def _lookup_store_code_by_vmn(agent: str, vmn: Optional[str]) -> Optional[str]:
         store_code = vmn_mappings.get(f"+{vmn}")
     
     if store_code:
-        print(f"[telephony] 🏪 VMN {vmn} → Store Code: {store_code}")
+        log.info("[telephony] 🏪 VMN %s → Store Code: %s", vmn, store_code)
         return store_code
     
-    print(f"[telephony] ⚠️ No store code mapping found for VMN: {vmn}")
+    log.warning("[telephony] ⚠️ No store code mapping found for VMN: %s", vmn)
     return None
 
 
+# Fallback prompt files already read: path -> (mtime_ns, text)
+_prompt_file_cache: Dict[str, tuple] = {}
+
+
 def _read_prompt_from_file(agent: str) -> str:
-    """Load prompt from local .txt file (fallback)."""
+    """Load prompt from local .txt file (fallback); re-read only when the file changes."""
     agent_lower = agent.lower()
-    prompt_filename = AGENT_PROMPTS.get(agent_lower, "kia_prompt.txt")
-    prompt_file = os.path.join(os.path.dirname(__file__), prompt_filename)
+    prompt_filename = AGENT_PROMPTS.get(agent_lower, _DEFAULT_PROMPT_FILE)
+    prompt_file = _PROMPT_PATHS.get(agent_lower) or os.path.join(_PROMPT_DIR, _DEFAULT_PROMPT_FILE)
     
     try:
+        mtime_ns = os.stat(prompt_file).st_mtime_ns
+        cached = _prompt_file_cache.get(prompt_file)
+        if cached and cached[0] == mtime_ns:
+            return cached[1]
         with open(prompt_file, "r", encoding="utf-8") as f:
-            print(f"[telephony] 📄 Loaded prompt from file: {prompt_filename}")
-            return f.read()
+            log.info("[telephony] 📄 Loaded prompt from file: %s", prompt_filename)
+            text = f.read()
+        _prompt_file_cache[prompt_file] = (mtime_ns, text)
+        return text
     except FileNotFoundError:
         return f"You are a helpful {agent} sales assistant. Be concise and friendly."
     except Exception:
         return "You are a helpful sales assistant. Be concise and friendly."
 
 
-def _read_prompt_text(agent: str = "spotlight") -> str:
+async def _read_prompt_text(agent: str = "spotlight") -> str:
     """
     Load prompt for the specified agent.
     Priority: 1) Admin UI API (database), 2) Local .txt file (fallback)
     """
     # Try API first (allows editing via Admin UI)
-    api_prompt = _fetch_prompt_from_api(agent)
+    api_prompt = await _fetch_prompt_from_api(agent)
     if api_prompt:
         return api_prompt
     
@@ -772,23 +1015,28 @@ def _read_prompt_text(agent: str = "spotlight") -> str:
     return _read_prompt_from_file(agent)
 
 
-def _extract_audio_b64_from_gemini_message(msg: Dict[str, Any]) -> Optional[str]:
-    parts = msg.get("serverContent", {}).get("modelTurn", {}).get("parts") or []
+def _extract_audio_b64_from_parts(parts: Optional[List[Any]]) -> Optional[str]:
     if not parts:
         return None
-    inline = parts[0].get("inlineData") if isinstance(parts[0], dict) else None
-    if inline and isinstance(inline, dict):
-        return inline.get("data")
-    return None
+    # Audio messages (the steady-state case) always carry inlineData.data, so
+    # index straight in; other shapes fall out through the exception
+    try:
+        return parts[0]["inlineData"]["data"]
+    except (KeyError, TypeError):
+        return None
 
 
-def _is_interrupted(msg: Dict[str, Any]) -> bool:
-    return bool(msg.get("serverContent", {}).get("interrupted"))
+def _is_interrupted(server_content: Optional[Dict[str, Any]]) -> bool:
+    return bool(server_content and server_content.get("interrupted"))
 
 
-def _extract_transcription(msg: Dict[str, Any], debug: bool = False) -> Optional[Dict[str, Any]]:
+def _extract_transcription(
+    server_content: Optional[Dict[str, Any]],
+    parts: Optional[List[Any]],
+    debug: bool = False,
+) -> Optional[Dict[str, Any]]:
     """
-    Extract transcription text from Gemini message.
+    Extract transcription text from a Gemini message's serverContent.
     
     Input transcription: serverContent.inputTranscription.text (user speech)
     Output transcription: serverContent.outputTranscription.text (agent speech)
@@ -796,36 +1044,35 @@ def _extract_transcription(msg: Dict[str, Any], debug: bool = False) -> Optional
     IMPORTANT: Agent speech contains corrected/confirmed data that should be
     used for extraction, as the agent confirms and corrects user input.
     """
-    server_content = msg.get("serverContent", {})
+    if not server_content:
+        return None  # setupComplete / toolCall / usage messages
     
     # Debug: log all keys in serverContent to see what Gemini is sending
-    if debug and server_content:
+    if debug:
         keys = list(server_content.keys())
         if keys and keys != ["modelTurn"]:  # Don't spam for audio-only messages
-            print(f"[DEBUG] serverContent keys: {keys}")
+            log.debug("[DEBUG] serverContent keys: %s", keys)
     
     # Input transcription (user speech - raw, may have errors)
-    input_trans = server_content.get("inputTranscription", {})
-    if input_trans and input_trans.get("text"):
+    input_trans = server_content.get("inputTranscription")
+    if input_trans and (text := input_trans.get("text")):
         return {
             "speaker": "user",
-            "text": input_trans["text"],
+            "text": text,
             "timestamp": _now_ist().isoformat(),
         }
     
     # Output transcription (agent speech - contains confirmed/corrected data)
-    output_trans = server_content.get("outputTranscription", {})
-    if output_trans and output_trans.get("text"):
+    output_trans = server_content.get("outputTranscription")
+    if output_trans and (text := output_trans.get("text")):
         return {
             "speaker": "agent",
-            "text": output_trans["text"],
+            "text": text,
             "timestamp": _now_ist().isoformat(),
         }
     
     # Fallback: Check modelTurn for text parts (older API format)
-    model_turn = server_content.get("modelTurn", {})
-    parts = model_turn.get("parts", [])
-    for part in parts:
+    for part in parts or ():
         if isinstance(part, dict) and part.get("text"):
             return {
                 "speaker": "agent",
@@ -836,6 +1083,54 @@ def _extract_transcription(msg: Dict[str, Any], debug: bool = False) -> Optional
     return None
 
 
+# Upper bound on chunks merged into one media frame when the sender catches up
+MAX_COALESCED_CHUNKS = 3
+
+# Crossfade between independently-resampled Gemini chunks:
+# 8 samples = 1ms at 8kHz — imperceptible but smooths edges
+XFADE = 8
+_XFADE_ALPHA = np.arange(1, XFADE + 1, dtype=np.float64) / XFADE  # ramp of the incoming chunk
+
+# Initial playback ring size in seconds of telephony audio. Gemini streams a
+# turn faster than real time, so a few seconds queue up before the sender
+# drains them; sizing for that up front avoids regrowing mid-turn.
+OUTPUT_RING_SEC = 4
+
+# Gemini audio messages at least this long (base64 chars, ~250ms of 24kHz
+# PCM) are decoded/resampled on _AUDIO_POOL instead of the event loop.
+# Smaller chunks are cheaper to process inline than the thread handoff.
+DSP_OFFLOAD_MIN_B64 = 16000
+
+# Threads for off-loop audio DSP. Kept apart from the default executor, whose
+# threads sit in blocking urllib calls (webhooks, Gemini extraction, knowledge
+# pool) and would otherwise delay a caller's audio behind another call's I/O.
+# numpy/soxr release the GIL while resampling, so this scales with cores.
+_AUDIO_POOL = concurrent.futures.ThreadPoolExecutor(
+    max_workers=os.cpu_count() or 1, thread_name_prefix="audio-dsp"
+)
+
+
+def _wake(fut: asyncio.Future) -> None:
+    if not fut.done():
+        fut.set_result(None)
+
+
+async def _sleep_until(loop: asyncio.AbstractEventLoop, deadline: float) -> None:
+    """
+    Sleep until an absolute `loop.time()` deadline.
+
+    Scheduling with call_at on the deadline itself (rather than sleep(wait)
+    on a delay computed from an earlier clock read) keeps the pacing clock
+    anchored, and skips the sleep() coroutine wrapper per chunk.
+    """
+    fut = loop.create_future()
+    handle = loop.call_at(deadline, _wake, fut)
+    try:
+        await fut
+    finally:
+        handle.cancel()
+
+
 async def _audio_sender(
     session: TelephonySession, cfg: Config
 ) -> None:
@@ -851,64 +1146,227 @@ async def _audio_sender(
     By pacing output at real-time rate (one 100ms chunk every 100ms), the local
     output_buffer acts as the playback queue. On barge-in, clearing the buffer
     immediately stops audio delivery — max overshoot is one chunk (~100ms).
+
+    For the same reason a deep buffer is NOT sent ahead in larger batches.
+    Chunks are only merged (ALLOW_SEND_COALESCE) to catch up on ticks that
+    were already missed, so a batch never runs ahead of the real-time clock.
     """
-    import time
 
+    loop = asyncio.get_running_loop()
     chunk_samples = cfg.AUDIO_BUFFER_SAMPLES_OUTPUT
     chunk_duration = cfg.AUDIO_BUFFER_MS_OUTPUT / 1000.0  # seconds
-    next_send_time: float | None = None
+    allow_coalesce = cfg.ALLOW_SEND_COALESCE
+    next_send_time: float | None = None  # absolute deadline on the loop clock
+
+    # Per-tick session objects, bound once (none of them is reassigned)
+    buf = session.output_buffer
+    ws = session.client_ws
+    audio_ready = session.audio_ready
+    playback_idle = session.playback_idle
 
     try:
         while not session.closed:
-            if len(session.output_buffer) >= chunk_samples:
-                now = time.monotonic()
-
+            if len(buf) >= chunk_samples:
                 # Pace: if we have a scheduled time, wait until then
                 if next_send_time is not None:
-                    wait = next_send_time - now
-                    if wait > 0:
-                        await asyncio.sleep(wait)
-                        # Re-check buffer — may have been cleared by barge-in
-                        if len(session.output_buffer) < chunk_samples:
+                    if next_send_time > loop.time():
+                        epoch = session.output_epoch
+                        await _sleep_until(loop, next_send_time)
+                        # Re-check buffer — a barge-in may have cleared it (and
+                        # a new response may already be queued): restart pacing
+                        if session.output_epoch != epoch or len(buf) < chunk_samples:
                             next_send_time = None
                             continue
 
-                chunk = session.output_buffer[:chunk_samples]
-                session.output_buffer = session.output_buffer[chunk_samples:]
-
-                payload = {
-                    "event": "media",
-                    "type": "media",
-                    "ucid": session.ucid,
-                    "data": {
-                        "samples": chunk,
-                        "bitsPerSample": 16,
-                        "sampleRate": cfg.TELEPHONY_SR,
-                        "channelCount": 1,
-                        "numberOfFrames": len(chunk),
-                        "type": "data",
-                    },
-                }
-                if session.client_ws.open:
-                    await session.client_ws.send(json.dumps(payload))
-                    # Audio output logging removed - too verbose
-                    # Transcripts show agent speech instead
+                # If the loop stalled (GC pause, CPU burst) and we missed whole
+                # ticks, optionally catch up by sending the missed chunks as one
+                # larger frame instead of one frame per tick.
+                n_chunks = 1
+                if allow_coalesce and next_send_time is not None:
+                    behind = int((loop.time() - next_send_time) // chunk_duration)
+                    if behind >= 1:
+                        n_chunks = min(
+                            behind + 1,
+                            MAX_COALESCED_CHUNKS,
+                            len(buf) // chunk_samples,
+                        )
 
-                # Schedule next send at exactly one chunk_duration later
+                chunk = buf.read(n_chunks * chunk_samples)
+
+                # No per-chunk ws.open probe: a closed socket raises
+                # ConnectionClosed from send(), and then nothing more can play
+                try:
+                    await ws.send(_encode_media_frame(session, chunk))
+                except ConnectionClosed:
+                    playback_idle.set()  # release a pending end-of-call drain wait
+                    return
+                # Audio output logging removed - too verbose
+                # Transcripts show agent speech instead
+
+                # Schedule next send at exactly one chunk_duration (per chunk sent) later
                 if next_send_time is None:
-                    next_send_time = time.monotonic() + chunk_duration
+                    next_send_time = loop.time() + chunk_duration
                 else:
-                    next_send_time += chunk_duration
+                    next_send_time += n_chunks * chunk_duration
                     # Prevent drift accumulation: if we fell too far behind, reset
-                    if next_send_time < time.monotonic() - chunk_duration:
-                        next_send_time = time.monotonic() + chunk_duration
+                    if next_send_time < loop.time() - chunk_duration:
+                        next_send_time = loop.time() + chunk_duration
             else:
-                # Buffer empty — reset pacing and poll quickly
+                # Less than a chunk queued — reset pacing and sleep until
+                # _gemini_reader signals that a full chunk is available
                 next_send_time = None
-                await asyncio.sleep(0.005)  # 5ms polling
+                audio_ready.clear()
+                playback_idle.set()
+                await audio_ready.wait()
+                playback_idle.clear()
     except Exception as e:
         if cfg.DEBUG:
-            print(f"[{session.ucid}] ❌ Audio sender error: {e}")
+            log.debug("[%s] ❌ Audio sender error: %s", session.ucid, e)
+
+
+async def _reject_function_call(
+    session: TelephonySession,
+    func_name: str,
+    func_id: str,
+    message: str,
+    redirect: str = "",
+) -> None:
+    """Reject a Gemini function call with explicit redirect instructions.
+    
+    The redirect message tells Gemini exactly what to do next,
+    preventing it from saying "I'll connect you to Sales Team"
+    after a rejected transfer_call().
+    """
+    log.warning("[%s] ⚠️ REJECTED %s() - %s", session.ucid, func_name, message)
+    # Build response with explicit redirect so Gemini doesn't go off-script
+    rejection_response: Dict[str, Any] = {"error": message}
+    if redirect:
+        rejection_response["instruction"] = redirect
+    try:
+        await session.gemini.send_function_response(
+            call_id=func_id,
+            func_name=func_name,
+            response=rejection_response,
+        )
+    except Exception as e:
+        log.warning("[%s] ⚠️ Failed to send function rejection: %s", session.ucid, e)
+
+
+async def _handle_transfer_call(
+    session: TelephonySession, func_name: str, func_id: str, reason: str, call_age: float
+) -> bool:
+    """Validate and accept/reject transfer_call(). Returns True if accepted."""
+    allow_transfer = False
+
+    # Debug: log exact state for transfer validation
+    log.info(
+        "[%s] 🔍 Transfer validation: last_user='%s', q_asked=%s, "
+        "q_answered=%s, answer_text='%s', turn_user='%s'",
+        session.ucid,
+        session.last_user_text,
+        session.transfer_question_asked_at is not None,
+        session.transfer_question_answered,
+        session.last_transfer_answer_text,
+        _turn_text(session.current_turn_user_parts)[:50],
+    )
+
+    if _is_explicit_transfer_request(session.last_user_text):
+        allow_transfer = True
+    elif (
+        session.transfer_question_asked_at
+        and session.transfer_question_answered
+    ):
+        # Gemini already heard the audio and decided the user
+        # wants to transfer.  Trust Gemini's decision UNLESS
+        # the transcribed answer is explicitly negative.
+        if _is_negative(session.last_transfer_answer_text):
+            # User said "no" — reject the transfer
+            pass
+        else:
+            # User said yes / affirmative / unclear → trust Gemini
+            allow_transfer = True
+
+    if not allow_transfer:
+        await _reject_function_call(
+            session, func_name, func_id,
+            "TRANSFER DENIED. You have NOT completed the required steps.",
+            redirect=(
+                "Do NOT transfer. Do NOT mention Sales Team. Do NOT say 'connect'. "
+                "Continue the NORMAL conversation flow: "
+                "1) Ask customer's NAME first, 2) Ask car MODEL, "
+                "3) Ask about TEST DRIVE, 4) Ask for EMAIL. "
+                "Respond to the customer's last message naturally."
+            ),
+        )
+        return False
+
+    log.info("[%s] 📞 Gemini 2.5 → transfer_call(): %s", session.ucid, reason)
+    session.user_wants_transfer = True
+    session.call_ending = True
+    # Send function response so Gemini can say goodbye
+    try:
+        await session.gemini.send_function_response(
+            call_id=func_id,
+            func_name=func_name,
+            response={"status": "ok", "action": "transferring to sales team"},
+        )
+    except Exception as e:
+        log.warning("[%s] ⚠️ Failed to send function response: %s", session.ucid, e)
+    log.info("[%s] ⏳ Waiting for goodbye message before transfer...", session.ucid)
+    return True
+
+
+async def _handle_end_call(
+    session: TelephonySession, func_name: str, func_id: str, reason: str, call_age: float
+) -> bool:
+    """Validate and accept/reject end_call(). Returns True if accepted."""
+    # Trust Gemini's end_call decision if the transfer question
+    # was asked and the user responded. Gemini heard the actual
+    # audio and may understand "no" even when transcription is
+    # garbled (e.g. "nahi" → "आईं"). Only reject if:
+    #   - Call is too short (already handled by the reader)
+    #   - Transfer question was never asked AND call < 60s
+    allow_end = True
+    if not session.transfer_question_asked_at and call_age < 60:
+        allow_end = False
+    
+    if not allow_end:
+        await _reject_function_call(
+            session, func_name, func_id,
+            "END CALL DENIED. Conversation is not complete yet.",
+            redirect=(
+                "Do NOT end the call. Do NOT say goodbye. "
+                "Continue collecting data from the customer. "
+                "You still need to ask the Sales Team transfer question. "
+                "Respond to the customer's last message naturally."
+            ),
+        )
+        return False
+
+    log.info("[%s] 📞 Gemini 2.5 → end_call(): %s", session.ucid, reason)
+    session.user_wants_transfer = False
+    session.call_ending = True
+    # Send function response so Gemini can say goodbye
+    try:
+        await session.gemini.send_function_response(
+            call_id=func_id,
+            func_name=func_name,
+            response={"status": "ok", "action": "ending call gracefully"},
+        )
+    except Exception as e:
+        log.warning("[%s] ⚠️ Failed to send function response: %s", session.ucid, e)
+    log.info("[%s] ⏳ Waiting for goodbye message before hangup...", session.ucid)
+    return True
+
+
+# Gemini call-control functions (see CALL_CONTROL_FUNCTIONS) → handler.
+# Each handler validates the call against session state and either accepts
+# it (call_ending is set; hangup/transfer happens at turnComplete) or
+# rejects it with redirect instructions for Gemini.
+_FUNCTION_CALL_HANDLERS = {
+    "transfer_call": _handle_transfer_call,
+    "end_call": _handle_end_call,
+}
 
 
 async def _gemini_reader(
@@ -924,25 +1382,40 @@ async def _gemini_reader(
     
     All decisions made by Gemini 2.5 Live based on conversation.
     """
+    # Bound once for the per-audio-message path below
+    loop = asyncio.get_running_loop()
+    out = session.output_buffer
+    decode_audio = audio_processor.process_output_gemini_b64_to_8k_samples
+    continuous = audio_processor.continuous_output
+    chunk_samples = cfg.AUDIO_BUFFER_SAMPLES_OUTPUT
+
     try:
         async for msg in session.gemini.messages():
             if cfg.DEBUG:
                 if msg.get("setupComplete"):
-                    print(f"[{session.ucid}] 🏁 Gemini setupComplete")
+                    log.debug("[%s] 🏁 Gemini setupComplete", session.ucid)
+
+            # Drill into the message once; the helpers below take the pieces.
+            # Messages with neither serverContent nor a toolCall (setupComplete,
+            # usage metadata) need no handling.
+            server_content = msg.get("serverContent")
+            if not server_content and "toolCall" not in msg:
+                continue
+            parts = _model_parts(server_content)
 
-            if _is_interrupted(msg):
+            if _is_interrupted(server_content):
                 # Barge-in: clear the output buffer immediately.
+                # Ring buffer clear is O(1) regardless of how much audio is queued.
                 if cfg.LOG_TRANSCRIPTS:
-                    print(f"[{session.ucid}] 🛑 Gemini interrupted → clearing output buffer")
-                session.output_buffer.clear()
+                    log.info("[%s] 🛑 Gemini interrupted → clearing output buffer", session.ucid)
+                out.clear()
+                session.output_epoch += 1
+                session.audio_ready.clear()  # nothing to play until the next response
+                audio_processor.reset_output()
 
                 # Also send clear event in case telephony provider supports it
                 try:
-                    clear_payload = {
-                        "event": "clear",
-                        "ucid": session.ucid,
-                    }
-                    await session.client_ws.send(json.dumps(clear_payload))
+                    await session.client_ws.send(session.clear_payload)
                 except Exception:
                     pass
                 continue
@@ -958,22 +1431,25 @@ async def _gemini_reader(
             # Flow: Gemini calls function → we acknowledge → Gemini says
             # goodbye → turnComplete → we send hangup/transfer to telephony
             # ─────────────────────────────────────────────────────────────────
-            func_call = _extract_function_call(msg)
-            if func_call and not session.hangup_sent and not session.call_ending:
+            # Session flags first: once the call is ending any function call is
+            # ignored, so the parts/toolCall probe is skipped entirely
+            func_call = (
+                None if session.hangup_sent or session.call_ending
+                else _extract_function_call(msg, parts)
+            )
+            if func_call:
                 func_name = func_call.get("name")
                 func_args = func_call.get("args", {})
                 func_id = func_call.get("id", "")
                 reason = func_args.get("reason", "User decision")
-                call_duration = time.time() - session.call_start_time
+                call_age = time.time() - session.call_start_time  # read once per function call
 
                 # ── Block function calls during language correction ──
                 # When we inject a language hint, Gemini sometimes interprets
                 # it as needing to call transfer_call().  Silently absorb the
                 # call and tell Gemini to continue the conversation normally.
                 if session.language_correction_pending:
-                    print(
-                        f"[{session.ucid}] ⚠️ Ignoring {func_name}() during language correction"
-                    )
+                    log.warning("[%s] ⚠️ Ignoring %s() during language correction", session.ucid, func_name)
                     try:
                         await session.gemini.send_function_response(
                             call_id=func_id,
@@ -989,8 +1465,11 @@ async def _gemini_reader(
 
                 # Minimal safeguard: reject only during initial WebSocket setup (<10s)
                 # After that, trust Gemini completely — including on-demand transfer
-                if call_duration < 10:
-                    print(f"[{session.ucid}] ⚠️ REJECTED {func_name}() - too early ({call_duration:.0f}s, still setting up)")
+                if call_age < 10:
+                    log.warning(
+                        "[%s] ⚠️ REJECTED %s() - too early (%.0fs, still setting up)",
+                        session.ucid, func_name, call_age,
+                    )
                     try:
                         await session.gemini.send_function_response(
                             call_id=func_id,
@@ -998,129 +1477,24 @@ async def _gemini_reader(
                             response={"error": "Call just started. Continue the conversation first."},
                         )
                     except Exception as e:
-                        print(f"[{session.ucid}] ⚠️ Failed to send function rejection: {e}")
+                        log.warning("[%s] ⚠️ Failed to send function rejection: %s", session.ucid, e)
                     continue
 
-                async def _reject_call(message: str, redirect: str = "") -> None:
-                    """Reject a Gemini function call with explicit redirect instructions.
-                    
-                    The redirect message tells Gemini exactly what to do next,
-                    preventing it from saying "I'll connect you to Sales Team"
-                    after a rejected transfer_call().
-                    """
-                    print(f"[{session.ucid}] ⚠️ REJECTED {func_name}() - {message}")
-                    # Build response with explicit redirect so Gemini doesn't go off-script
-                    rejection_response: Dict[str, Any] = {"error": message}
-                    if redirect:
-                        rejection_response["instruction"] = redirect
-                    try:
-                        await session.gemini.send_function_response(
-                            call_id=func_id,
-                            func_name=func_name,
-                            response=rejection_response,
-                        )
-                    except Exception as e:
-                        print(f"[{session.ucid}] ⚠️ Failed to send function rejection: {e}")
-                
-                if func_name == "transfer_call":
-                    allow_transfer = False
-
-                    # Debug: log exact state for transfer validation
-                    print(
-                        f"[{session.ucid}] 🔍 Transfer validation: "
-                        f"last_user='{session.last_user_text}', "
-                        f"q_asked={session.transfer_question_asked_at is not None}, "
-                        f"q_answered={session.transfer_question_answered}, "
-                        f"answer_text='{session.last_transfer_answer_text}', "
-                        f"turn_user='{(session.current_turn_user_text or '').strip()[:50]}'"
-                    )
-
-                    if _is_explicit_transfer_request(session.last_user_text):
-                        allow_transfer = True
-                    elif (
-                        session.transfer_question_asked_at
-                        and session.transfer_question_answered
-                    ):
-                        # Gemini already heard the audio and decided the user
-                        # wants to transfer.  Trust Gemini's decision UNLESS
-                        # the transcribed answer is explicitly negative.
-                        if _is_negative(session.last_transfer_answer_text):
-                            # User said "no" — reject the transfer
-                            pass
-                        else:
-                            # User said yes / affirmative / unclear → trust Gemini
-                            allow_transfer = True
-
-                    if not allow_transfer:
-                        await _reject_call(
-                            "TRANSFER DENIED. You have NOT completed the required steps.",
-                            redirect=(
-                                "Do NOT transfer. Do NOT mention Sales Team. Do NOT say 'connect'. "
-                                "Continue the NORMAL conversation flow: "
-                                "1) Ask customer's NAME first, 2) Ask car MODEL, "
-                                "3) Ask about TEST DRIVE, 4) Ask for EMAIL. "
-                                "Respond to the customer's last message naturally."
-                            ),
-                        )
-                        continue
-
-                    print(f"[{session.ucid}] 📞 Gemini 2.5 → transfer_call(): {reason}")
-                    session.user_wants_transfer = True
-                    session.call_ending = True
-                    # Send function response so Gemini can say goodbye
-                    try:
-                        await session.gemini.send_function_response(
-                            call_id=func_id,
-                            func_name=func_name,
-                            response={"status": "ok", "action": "transferring to sales team"},
-                        )
-                    except Exception as e:
-                        print(f"[{session.ucid}] ⚠️ Failed to send function response: {e}")
-                    print(f"[{session.ucid}] ⏳ Waiting for goodbye message before transfer...")
-                    
-                elif func_name == "end_call":
-                    # Trust Gemini's end_call decision if the transfer question
-                    # was asked and the user responded. Gemini heard the actual
-                    # audio and may understand "no" even when transcription is
-                    # garbled (e.g. "nahi" → "आईं"). Only reject if:
-                    #   - Call is too short (already handled above)
-                    #   - Transfer question was never asked AND call < 60s
-                    allow_end = True
-                    if not session.transfer_question_asked_at and call_duration < 60:
-                        allow_end = False
-                    
-                    if not allow_end:
-                        await _reject_call(
-                            "END CALL DENIED. Conversation is not complete yet.",
-                            redirect=(
-                                "Do NOT end the call. Do NOT say goodbye. "
-                                "Continue collecting data from the customer. "
-                                "You still need to ask the Sales Team transfer question. "
-                                "Respond to the customer's last message naturally."
-                            ),
-                        )
-                        continue
-
-                    print(f"[{session.ucid}] 📞 Gemini 2.5 → end_call(): {reason}")
-                    session.user_wants_transfer = False
-                    session.call_ending = True
-                    # Send function response so Gemini can say goodbye
-                    try:
-                        await session.gemini.send_function_response(
-                            call_id=func_id,
-                            func_name=func_name,
-                            response={"status": "ok", "action": "ending call gracefully"},
-                        )
-                    except Exception as e:
-                        print(f"[{session.ucid}] ⚠️ Failed to send function response: {e}")
-                    print(f"[{session.ucid}] ⏳ Waiting for goodbye message before hangup...")
+                handler = _FUNCTION_CALL_HANDLERS.get(func_name)
+                if handler and not await handler(session, func_name, func_id, reason, call_age):
+                    continue  # Rejected — Gemini was told how to continue
             
             # ─────────────────────────────────────────────────────────────────
             # Handle turnComplete - if call is ending, NOW trigger hangup
             # This ensures Gemini finishes saying goodbye before we hangup
             # ─────────────────────────────────────────────────────────────────
-            server_content = msg.get("serverContent", {})
-            if server_content.get("turnComplete") and not session.hangup_sent:
+            turn_complete = bool(server_content and server_content.get("turnComplete"))
+            if turn_complete and not session.hangup_sent:
+                # Drain the tail of the turn still held in the streaming resampler (no-op without soxr)
+                out.extend(audio_processor.flush_output())
+                if len(out) >= chunk_samples:
+                    session.audio_ready.set()
+
                 # ── Language correction response handling — MUST be first ──
                 # If this turnComplete is from Gemini's response to our
                 # language injection, just reset flags and move on.
@@ -1129,8 +1503,8 @@ async def _gemini_reader(
                 # and we don't want that to falsely set transfer_question_asked_at.
                 if session.language_correction_pending:
                     session.language_correction_pending = False
-                    session.current_turn_agent_text = ""
-                    session.current_turn_user_text = ""
+                    session.current_turn_agent_parts.clear()
+                    session.current_turn_user_parts.clear()
                     continue
 
                 # ── Check accumulated agent text for transfer question ──
@@ -1138,12 +1512,15 @@ async def _gemini_reader(
                 # "Team", "se baat", "chahenge?"). Individual chunks never
                 # contain the full phrase, so we accumulate per-turn and
                 # check the full sentence at turnComplete.
-                if session.current_turn_agent_text.strip():
-                    full_turn_text = session.current_turn_agent_text.strip()
-                    if _is_transfer_question(full_turn_text):
-                        print(
-                            f"[{session.ucid}] 📋 Transfer question detected in turn: "
-                            f"'{full_turn_text[:60]}...'"
+                # Join and normalize the agent's turn once for the
+                # transfer-question, language and goodbye checks below
+                full_turn_text = _turn_text(session.current_turn_agent_parts)
+                turn_agent_norm = _normalize_text(full_turn_text)
+                if turn_agent_norm:
+                    if _is_transfer_question_norm(turn_agent_norm):
+                        log.info(
+                            "[%s] 📋 Transfer question detected in turn: '%s...'",
+                            session.ucid, full_turn_text[:60],
                         )
                         session.transfer_question_asked_at = time.time()
                         session.transfer_question_answered = False
@@ -1154,21 +1531,20 @@ async def _gemini_reader(
                 # If user spoke English but agent replied in Hindi,
                 # inject a corrective text context so Gemini adjusts.
                 if (
-                    session.current_turn_agent_text.strip()
+                    full_turn_text
                     and not session.call_ending
                     and not session.hangup_sent
                 ):
-                    agent_lang = _detect_agent_language(session.current_turn_agent_text)
-                    user_text = session.current_turn_user_text.strip()
+                    agent_lang = _detect_agent_language(turn_agent_norm)
+                    user_text = _turn_text(session.current_turn_user_parts)
                     user_lang, user_cat = _detect_language(user_text) if user_text else ("unknown", "A")
 
                     # Update language state on Category B user utterance
                     if user_cat == "B" and user_lang in ("hindi", "english"):
                         if session.language_state != user_lang:
-                            print(
-                                f"[{session.ucid}] 🌐 Language state: "
-                                f"{session.language_state} → {user_lang} "
-                                f"(Category B: '{user_text[:50]}')"
+                            log.info(
+                                "[%s] 🌐 Language state: %s → %s (Category B: '%s')",
+                                session.ucid, session.language_state, user_lang, user_text[:50],
                             )
                         session.language_state = user_lang
 
@@ -1177,10 +1553,9 @@ async def _gemini_reader(
                         agent_lang != "unknown"
                         and session.language_state != agent_lang
                     ):
-                        print(
-                            f"[{session.ucid}] ⚠️ Language mismatch! "
-                            f"Expected={session.language_state}, "
-                            f"Agent spoke={agent_lang}. Injecting correction."
+                        log.warning(
+                            "[%s] ⚠️ Language mismatch! Expected=%s, Agent spoke=%s. Injecting correction.",
+                            session.ucid, session.language_state, agent_lang,
                         )
                         session.language_correction_pending = True
                         # NOTE: Do NOT suppress audio. Gemini re-generates the question
@@ -1192,25 +1567,21 @@ async def _gemini_reader(
                                 session.language_state
                             )
                         except Exception as e:
-                            print(f"[{session.ucid}] ⚠️ Language injection failed: {e}")
+                            log.warning("[%s] ⚠️ Language injection failed: %s", session.ucid, e)
                             session.language_correction_pending = False
                         # Reset text and skip call-end logic for this turn
-                        session.current_turn_agent_text = ""
-                        session.current_turn_user_text = ""
+                        session.current_turn_agent_parts.clear()
+                        session.current_turn_user_parts.clear()
                         continue
 
-                # Grab accumulated turn text before reset (needed for goodbye check)
-                _turn_agent_text = session.current_turn_agent_text.strip()
-
-                # Reset accumulated text for next turn
-                session.current_turn_agent_text = ""
-                session.current_turn_user_text = ""
-
-                call_age = time.time() - session.call_start_time
+                # Reset accumulated text for next turn (turn_agent_norm keeps
+                # the normalized text for the goodbye check)
+                session.current_turn_agent_parts.clear()
+                session.current_turn_user_parts.clear()
 
                 if session.call_ending:
                     # Normal path: Gemini called end_call/transfer_call, goodbye done
-                    print(f"[{session.ucid}] ✅ Goodbye message complete - triggering call end")
+                    log.info("[%s] ✅ Goodbye message complete - triggering call end", session.ucid)
                     # Set hangup_sent IMMEDIATELY to prevent duplicate tasks
                     # (audio drain wait inside _handle_call_end is async)
                     session.hangup_sent = True
@@ -1224,16 +1595,20 @@ async def _gemini_reader(
                     # This is state-based (not text matching) — the transfer
                     # question is always the final step, so if user answered and
                     # agent finished speaking, the call is done.
-                    print(
-                        f"[{session.ucid}] 🔄 Auto-hangup: transfer question answered "
-                        f"but Gemini didn't call end_call() — triggering hangup"
+                    log.info(
+                        "[%s] 🔄 Auto-hangup: transfer question answered "
+                        "but Gemini didn't call end_call() — triggering hangup",
+                        session.ucid,
                     )
                     session.user_wants_transfer = False
                     session.call_ending = True
                     # Set hangup_sent IMMEDIATELY to prevent duplicate tasks
                     session.hangup_sent = True
                     asyncio.create_task(_handle_call_end(session, cfg))
-                elif call_age > 30 and _is_goodbye_message(_turn_agent_text):
+                elif (
+                    (call_age := time.time() - session.call_start_time) > 30
+                    and _is_goodbye_norm(turn_agent_norm)
+                ):
                     # Safety net B: Goodbye detection.
                     # Agent said a clear goodbye phrase (e.g. "Have a great day!")
                     # but Gemini didn't call end_call() AND the transfer question
@@ -1242,9 +1617,9 @@ async def _gemini_reader(
                     #   - Gemini skipped the transfer question
                     #   - Transfer question phrasing wasn't detected
                     # Only triggers after 30s to avoid false positives on greetings.
-                    print(
-                        f"[{session.ucid}] 🔄 Goodbye detected — triggering hangup "
-                        f"(agent: '{_turn_agent_text[:60]}...', call_age={call_age:.0f}s)"
+                    log.info(
+                        "[%s] 🔄 Goodbye detected — triggering hangup (agent: '%s...', call_age=%.0fs)",
+                        session.ucid, full_turn_text[:60], call_age,
                     )
                     session.user_wants_transfer = False
                     session.call_ending = True
@@ -1252,9 +1627,10 @@ async def _gemini_reader(
                     asyncio.create_task(_handle_call_end(session, cfg))
 
             # Capture transcription if present
-            transcription = _extract_transcription(msg, debug=cfg.DEBUG)
+            transcription = _extract_transcription(server_content, parts, debug=cfg.DEBUG)
             if transcription:
                 session.conversation.append(transcription)
+                await _spool_conversation(session, cfg)
                 speaker = transcription["speaker"]
                 text = transcription.get("text", "")
 
@@ -1262,7 +1638,7 @@ async def _gemini_reader(
                     session.last_user_text = text
                     session.last_user_at = time.time()
                     # Accumulate user text for language detection at turnComplete
-                    session.current_turn_user_text += " " + text
+                    session.current_turn_user_parts.append(text)
                     if session.transfer_question_asked_at and not session.transfer_question_answered:
                         session.transfer_question_answered = True
                         session.last_transfer_answer_text = text
@@ -1271,21 +1647,30 @@ async def _gemini_reader(
                     # Accumulate agent text within the current turn.
                     # Transfer question detection happens at turnComplete
                     # using the full accumulated text (not individual chunks).
-                    session.current_turn_agent_text += " " + text
+                    session.current_turn_agent_parts.append(text)
                 
                 # Always log transcripts (these are valuable)
                 if cfg.LOG_TRANSCRIPTS:
-                    display_text = text[:80] + "..." if len(text) > 80 else text
-                    print(f"[{session.ucid}] 📝 {speaker}: {display_text}")
+                    # %.80s truncates inside the log formatter (no slice/concat here)
+                    log.info(
+                        "[%s] 📝 %s: %.80s%s", session.ucid, speaker, text,
+                        "..." if len(text) > 80 else "",
+                    )
 
-            audio_b64 = _extract_audio_b64_from_gemini_message(msg)
+            # Hangup/transfer is under way: the goodbye turn is already queued
+            # (and padded so it drains), so later audio would never be played
+            # and would only hold up the drain. Transcripts above still count.
+            if session.hangup_sent:
+                continue
+
+            audio_b64 = _extract_audio_b64_from_parts(parts)
             if not audio_b64:
                 continue
 
             # Skip audio if Gemini is acknowledging language correction
             # (e.g., "[Acknowledged. The customer is speaking Hindi...]")
             if session.language_correction_pending:
-                agent_text_so_far = session.current_turn_agent_text.strip().lower()
+                agent_text_so_far = _turn_text(session.current_turn_agent_parts).lower()
                 # Detect acknowledgment phrases
                 ack_patterns = [
                     "[acknowledged",
@@ -1295,33 +1680,76 @@ async def _gemini_reader(
                 ]
                 if any(pattern in agent_text_so_far for pattern in ack_patterns):
                     # Skip this audio chunk - it's the acknowledgment, not the re-asked question
-                    if cfg.DEBUG:
-                        print(f"[{session.ucid}] 🔇 Skipping acknowledgment audio during language correction")
+                    log.debug("[%s] 🔇 Skipping acknowledgment audio during language correction", session.ucid)
                     continue
 
-            # Buffer audio — the _audio_sender task handles paced delivery
-            samples_8k = audio_processor.process_output_gemini_b64_to_8k_samples(audio_b64)
+            # Buffer audio — the _audio_sender task handles paced delivery.
+            # Large chunks are decoded off-loop; each is awaited before the next
+            # message is read, so the stateful resampler never sees two at once.
+            if len(audio_b64) >= DSP_OFFLOAD_MIN_B64:
+                samples_8k = await loop.run_in_executor(_AUDIO_POOL, decode_audio, audio_b64)
+            else:
+                samples_8k = decode_audio(audio_b64)
 
             # Crossfade at chunk boundary to prevent clicks/pops between
-            # independently-resampled Gemini audio chunks
-            XFADE = 8  # 8 samples = 1ms at 8kHz — imperceptible but smooths edges
-            if session.output_buffer and len(samples_8k) > XFADE:
-                buf_len = len(session.output_buffer)
-                for i in range(min(XFADE, buf_len)):
-                    alpha = (i + 1) / XFADE
-                    idx = buf_len - XFADE + i
-                    if idx >= 0:
-                        session.output_buffer[idx] = int(
-                            session.output_buffer[idx] * (1 - alpha) + samples_8k[i] * alpha
-                        )
-                session.output_buffer.extend(samples_8k[XFADE:])
+            # independently-resampled Gemini audio chunks (streaming soxr
+            # output is already continuous, so it is queued as-is)
+            if out and len(samples_8k) > XFADE and not continuous:
+                out.extend_crossfaded(samples_8k, _XFADE_ALPHA)
             else:
-                session.output_buffer.extend(samples_8k)
+                out.extend(samples_8k)
+
+            # Wake the sender once there is at least one full chunk to play
+            if len(out) >= chunk_samples:
+                session.audio_ready.set()
     except Exception as e:
         if cfg.DEBUG:
-            print(f"[{session.ucid}] ❌ Gemini reader error: {e}")
+            log.debug("[%s] ❌ Gemini reader error: %s", session.ucid, e)
     finally:
-        print(f"[{session.ucid}] ⚠️ Gemini reader exited (conversation entries: {len(session.conversation)})")
+        total_entries = session.spooled_entries + len(session.conversation)
+        log.warning("[%s] ⚠️ Gemini reader exited (conversation entries: %s)", session.ucid, total_entries)
+
+
+async def _spool_conversation(session: TelephonySession, cfg: Config) -> None:
+    """
+    Keep session.conversation bounded on long calls.
+
+    Once the in-memory list reaches twice MAX_LIVE_TRANSCRIPT_ENTRIES, the
+    older half is appended to the agent's transcript spool (off the event
+    loop) and dropped from memory. _save_call_data stitches it back together.
+    """
+    keep = cfg.MAX_LIVE_TRANSCRIPT_ENTRIES
+    if keep <= 0 or not cfg.ENABLE_DATA_STORAGE or len(session.conversation) < 2 * keep:
+        return
+    # One append at a time, so spooled entries land in order
+    if session.spool_write is not None and not session.spool_write.done():
+        return
+
+    # Move the entries out of memory and count them *before* the write, so a
+    # cancelled call (the write keeps running in its thread) still has a
+    # spooled_entries count that makes _save_call_data read the spool back
+    older = session.conversation[:-keep]
+    del session.conversation[: len(older)]
+    session.spooled_entries += len(older)
+
+    def _restore_if_unwritten(write: asyncio.Future) -> None:
+        if write.cancelled() or write.exception() is not None or not write.result():
+            session.conversation[:0] = older
+            session.spooled_entries -= len(older)
+
+    storage = AgentDataStorage(session.agent, cfg)
+    loop = asyncio.get_running_loop()
+    write = loop.run_in_executor(
+        None, storage.append_transcript_spool, session.ucid, session.spool_id, older
+    )
+    write.add_done_callback(_restore_if_unwritten)
+    session.spool_write = write
+    # Shielded: cancelling this reader must not cancel the write's bookkeeping
+    if await asyncio.shield(write) and cfg.DEBUG:
+        log.debug(
+            "[%s] 💾 Spooled %s transcript entries (%s total)",
+            session.ucid, len(older), session.spooled_entries,
+        )
 
 
 async def _handle_call_end(session: TelephonySession, cfg: Config) -> None:
@@ -1337,12 +1765,22 @@ async def _handle_call_end(session: TelephonySession, cfg: Config) -> None:
     site) to prevent duplicate tasks from race conditions with turnComplete events.
     """
     try:
-        # Wait for output buffer to drain so goodbye audio plays
-        # Check every 100ms, timeout after 5 seconds
-        wait_time = 0
-        while len(session.output_buffer) > 0 and wait_time < 5.0:
-            await asyncio.sleep(0.1)
-            wait_time += 0.1
+        # Wait for output buffer to drain so goodbye audio plays (timeout 5s).
+        # The sender only sends whole chunks, so pad the goodbye's last partial
+        # chunk with silence — otherwise it never drains and we'd always hit
+        # the timeout.
+        chunk_samples = cfg.AUDIO_BUFFER_SAMPLES_OUTPUT
+        buffered = len(session.output_buffer)
+        if buffered:
+            remainder = buffered % chunk_samples
+            if remainder:
+                session.output_buffer.extend([0] * (chunk_samples - remainder))
+            session.playback_idle.clear()
+            session.audio_ready.set()
+            try:
+                await asyncio.wait_for(session.playback_idle.wait(), timeout=5.0)
+            except asyncio.TimeoutError:
+                pass
         
         # Extra 500ms to ensure audio is fully delivered to caller's phone
         await asyncio.sleep(0.5)
@@ -1353,7 +1791,7 @@ async def _handle_call_end(session: TelephonySession, cfg: Config) -> None:
             # User wants to talk to a sales agent - send transfer event
             # Waybeo transfer_call uses only UCID; number is not required
             transfer_number = session.transfer_number or os.getenv("DEFAULT_TRANSFER_NUMBER", "")
-            print(f"[{session.ucid}] 📞 User requested transfer → calling Waybeo transfer API")
+            log.info("[%s] 📞 User requested transfer → calling Waybeo transfer API", session.ucid)
             transfer_ok = await send_transfer_event(session, transfer_number or None, cfg)
             session.call_control_event = {
                 "type": "transfer",
@@ -1364,8 +1802,8 @@ async def _handle_call_end(session: TelephonySession, cfg: Config) -> None:
             }
         else:
             # User declined transfer or didn't respond - send hangup
-            reason = "User declined agent transfer" if session.user_wants_transfer is False else "Call completed"
-            print(f"[{_ist_str()}] [{session.ucid}] 📞 Calling Waybeo hangup API: {reason}")
+            reason = "User declined agent transfer" if session.user_wants_transfer is False else DEFAULT_HANGUP_REASON
+            log.info("[%s] [%s] 📞 Calling Waybeo hangup API: %s", _ist_str(), session.ucid, reason)
             await send_hangup_event(session, cfg, reason)
             session.call_control_event = {
                 "type": "hangup",
@@ -1376,7 +1814,171 @@ async def _handle_call_end(session: TelephonySession, cfg: Config) -> None:
             
     except Exception as e:
         if cfg.DEBUG:
-            print(f"[{session.ucid}] ❌ Error handling call end: {e}")
+            log.debug("[%s] ❌ Error handling call end: %s", session.ucid, e)
+
+
+class _CallEnded(Exception):
+    """Raised by _client_receive_loop to end the call and cancel its sibling tasks."""
+
+
+async def _client_receive_loop(
+    session: TelephonySession, audio_processor: AudioProcessor, cfg: Config
+) -> None:
+    """
+    Read Waybeo media/stop events and forward caller audio to Gemini.
+    Raises _CallEnded when the call is over so the session TaskGroup tears down.
+    """
+    # Maximum call duration safeguard (5 minutes = 300 seconds)
+    MAX_CALL_DURATION_SEC = 300
+    # Caller audio is forwarded in whole chunks of this many int16 bytes
+    chunk_bytes = cfg.AUDIO_BUFFER_SAMPLES_INPUT * 2
+
+    # Process remaining messages
+    async for raw in session.client_ws:
+        # Check if call has exceeded maximum duration (safeguard against stuck sessions)
+        elapsed = time.time() - session.call_start_time
+        if elapsed > MAX_CALL_DURATION_SEC and not session.call_ending:
+            log.info(
+                "[%s] ⏱️ Call exceeded %ss limit (%ss elapsed)",
+                session.ucid, MAX_CALL_DURATION_SEC, int(elapsed),
+            )
+            log.info("[%s] 🚨 Forcing call termination to prevent stuck session", session.ucid)
+            session.call_ending = True
+            
+            # Send hangup if not already sent
+            if not session.hangup_sent:
+                session.hangup_sent = True
+                asyncio.create_task(_send_hangup(
+                    session, 
+                    reason="max_duration_exceeded",
+                    cfg=cfg
+                ))
+            
+            # Close Gemini connection
+            if session.gemini:
+                asyncio.create_task(session.gemini.close())
+            
+            # Break to trigger cleanup
+            break
+
+        try:
+            msg = fast_json.loads(raw)
+        except fast_json.JSONDecodeError:
+            continue
+
+        # Media frames are nearly every message, so they are tested first
+        event = msg.get("event")
+        if event == "media" and msg.get("data"):
+            samples = msg["data"].get("samples", [])
+            if not samples:
+                continue
+
+            # Keep caller audio as packed int16 bytes (2 bytes/sample) rather
+            # than a list of Python ints
+            session.input_buffer += audio_processor.waybeo_samples_to_np(samples).tobytes()
+
+            # Forward every whole chunk that is ready as ONE Gemini frame:
+            # when a large Waybeo frame (or a backlog) completes several chunks
+            # at once, they go out together instead of as back-to-back sends
+            ready = len(session.input_buffer) // chunk_bytes * chunk_bytes
+            if ready:
+                # Resample straight from a view of the buffer (no slice copy),
+                # then drop the view so the bytearray may shrink again
+                samples_np = np.frombuffer(session.input_buffer, dtype=np.int16, count=ready // 2)
+                audio_b64 = audio_processor.process_input_8k_to_gemini_16k_b64(samples_np)
+                del samples_np
+                del session.input_buffer[:ready]
+                await session.gemini.send_audio_b64_pcm16(audio_b64)
+
+            # Audio chunk logging is too verbose - removed to keep logs clean
+            # Transcripts still show what Gemini hears/says
+            continue
+
+        if event in {"stop", "end", "close"}:
+            if cfg.LOG_TRANSCRIPTS:
+                log.info("[%s] 📞 stop event received", session.ucid)
+            
+            # If we haven't sent hangup yet, send it now as a fallback
+            if not session.hangup_sent:
+                session.hangup_sent = True
+                reason = "Call ended by telephony provider"
+                if cfg.DEBUG:
+                    log.debug("[%s] 📞 Fallback hangup (stop event)", session.ucid)
+                # Note: Don't await here to avoid blocking, and stop event means
+                # the call is already ending on the telephony side
+            
+            break
+
+    log.info("[%s] 📞 Main WS loop ended (normal exit)", session.ucid)
+    raise _CallEnded()
+
+
+# Where each call field may appear, in priority order: (section, key) pairs
+# in the Waybeo start event (section None = top level, else a nested object),
+# then ("header", name) for lowercased WebSocket request headers.
+_UCID_SOURCES = (
+    (None, "ucid"), ("start", "ucid"), ("data", "ucid"),
+    ("header", "x-waybeo-ucid"), ("header", "ucid"),
+)
+_CUSTOMER_NUMBER_SOURCES = (
+    (None, "did"),  # Waybeo sends customer number in "did" field
+    (None, "customer_number"), (None, "caller_number"), (None, "customerId"),
+    (None, "From"), (None, "customer_mobile"),
+    ("data", "did"), ("data", "customer_number"), ("data", "caller_number"),
+    ("start", "did"),
+    ("header", "x-waybeo-caller-number"),
+)
+_VMN_SOURCES = ((None, "vmn"), ("data", "vmn"), ("start", "vmn"))
+_STORE_CODE_SOURCES = (
+    (None, "store_code"), ("data", "store_code"),
+    ("header", "x-waybeo-store-code"), ("header", "store_code"),
+)
+
+
+def _start_field(
+    start_msg: Dict[str, Any], sources: tuple, headers_lc: Dict[str, str]
+) -> Optional[Any]:
+    """First truthy value among `sources` (see _UCID_SOURCES), else None."""
+    for section, key in sources:
+        if section is None:
+            container = start_msg
+        elif section == "header":
+            container = headers_lc
+        else:
+            container = start_msg.get(section)
+            if not isinstance(container, dict):
+                continue
+        value = container.get(key)
+        if value:
+            return value
+    return None
+
+
+# Header names whose values are masked in the connection log (matched
+# against the lowercased name, so e.g. Authorization and X-Auth-Token both hit)
+_SENSITIVE_HEADER_RE = re.compile("auth|token|cookie")
+
+# DEBUG start-event logging prints top-level lists up to this many elements
+START_LOG_MAX_LIST = 32
+
+GEMINI_SERVICE_URL = (
+    "wss://us-central1-aiplatform.googleapis.com/ws/"
+    "google.cloud.aiplatform.v1beta1.LlmBidiService/BidiGenerateContent"
+)
+
+# Pre-dialed Gemini sockets (set up in main() when GEMINI_WARM_POOL > 0)
+_gemini_pool: Optional[GeminiConnectionPool] = None
+
+# Python 3.12+: a task built by eager_task_factory runs its coroutine immediately,
+# up to the first await, instead of waiting for the next loop iteration
+_eager_task_factory = getattr(asyncio, "eager_task_factory", None)
+
+
+def _create_eager_task(coro) -> asyncio.Task:
+    """asyncio.create_task(), started eagerly where the running Python supports it."""
+    if _eager_task_factory is None:
+        return asyncio.create_task(coro)
+    return _eager_task_factory(asyncio.get_running_loop(), coro)
 
 
 async def handle_client(client_ws, path: str):
@@ -1385,46 +1987,47 @@ async def handle_client(client_ws, path: str):
 
     # websockets passes the request path including querystring (e.g. "/wsNew1?agent=spotlight").
     # Waybeo/Ozonetel commonly append query params; accept those as long as the base path matches.
-    parsed_url = urlparse(path or "")
-    base_path = parsed_url.path
-    query_params = parse_qs(parsed_url.query)
+    # Only the base path and the "agent" param are needed, so split by hand
+    # instead of running urlparse/parse_qs on every connection.
+    base_path, _, query = (path or "").partition("?")
     
     # Extract agent parameter (default to "spotlight" for Kia)
-    agent = query_params.get("agent", ["spotlight"])[0]
+    agent = "spotlight"
+    for kv in query.split("&"):
+        if kv.startswith("agent=") and len(kv) > 6:  # parse_qs ignored blank values
+            agent = unquote_plus(kv[6:])
+            break
 
     # Only accept configured base path (e.g. /ws or /wsNew1)
     if base_path != cfg.WS_PATH:
         if cfg.DEBUG:
-            print(
-                f"[telephony] ❌ Rejecting connection: path={path!r} base_path={base_path!r} expected={cfg.WS_PATH!r}"
+            log.debug(
+                "[telephony] ❌ Rejecting connection: path=%r base_path=%r expected=%r",
+                path, base_path, cfg.WS_PATH,
             )
         await client_ws.close(code=1008, reason="Invalid path")
         return
 
     # Strict validation: reject unknown agents
-    if agent.lower() not in VALID_AGENTS:
-        print(f"[telephony] ❌ Rejecting unknown agent: {agent!r} (valid: {VALID_AGENTS})")
+    if agent not in VALID_AGENTS and agent.lower() not in VALID_AGENTS:
+        log.error("[telephony] ❌ Rejecting unknown agent: %r (valid: %s)", agent, VALID_AGENTS)
         await client_ws.close(code=1008, reason=f"Unknown agent: {agent}")
         return
 
     if cfg.DEBUG:
-        print(f"[telephony] 🎯 Agent: {agent}")
+        log.debug("[telephony] 🎯 Agent: %s", agent)
 
     rates = AudioRates(
         telephony_sr=cfg.TELEPHONY_SR,
         gemini_input_sr=cfg.GEMINI_INPUT_SR,
         gemini_output_sr=cfg.GEMINI_OUTPUT_SR,
     )
-    audio_processor = AudioProcessor(rates)
+    audio_processor = get_audio_processor(rates).for_session()
 
-    prompt = _read_prompt_text(agent)
+    prompt = await _read_prompt_text(agent)
 
-    service_url = (
-        "wss://us-central1-aiplatform.googleapis.com/ws/"
-        "google.cloud.aiplatform.v1beta1.LlmBidiService/BidiGenerateContent"
-    )
     gemini_cfg = GeminiSessionConfig(
-        service_url=service_url,
+        service_url=GEMINI_SERVICE_URL,
         model_uri=cfg.model_uri,
         voice=cfg.GEMINI_VOICE,
         system_instructions=prompt,
@@ -1454,16 +2057,22 @@ async def handle_client(client_ws, path: str):
                 waybeo_headers = {k: v for k, v in request.headers.raw_items()}
     except Exception as e:
         if cfg.DEBUG:
-            print(f"[telephony] ⚠️ Failed to capture WS headers: {e}")
-
-    if waybeo_headers:
-        print(f"[telephony] 📋 Waybeo headers received:")
-        for hdr_key, hdr_val in waybeo_headers.items():
-            # Mask auth tokens for security, show everything else
-            if "auth" in hdr_key.lower() or "token" in hdr_key.lower():
-                print(f"[telephony]   {hdr_key}: {hdr_val[:20]}...***")
-            else:
-                print(f"[telephony]   {hdr_key}: {hdr_val}")
+            log.debug("[telephony] ⚠️ Failed to capture WS headers: %s", e)
+
+    # Header names are case-insensitive: look them up in one lowercased copy
+    # (waybeo_headers keeps the original casing for Admin UI display)
+    headers_lc: Dict[str, str] = {}
+    header_lines = []
+    for hdr_key, hdr_val in waybeo_headers.items():
+        key_lc = hdr_key.lower()
+        headers_lc[key_lc] = hdr_val
+        # Mask credentials for security, show everything else
+        if _SENSITIVE_HEADER_RE.search(key_lc):
+            header_lines.append(f"[telephony]   {hdr_key}: {hdr_val[:20]}...***")
+        else:
+            header_lines.append(f"[telephony]   {hdr_key}: {hdr_val}")
+    if header_lines:
+        log.info("[telephony] 📋 Waybeo headers received:\n%s", "\n".join(header_lines))
 
     # Create session with temporary ucid until 'start' arrives
     ucid = "UNKNOWN"
@@ -1474,8 +2083,8 @@ async def handle_client(client_ws, path: str):
         agent=agent,
         client_ws=client_ws,
         gemini=gemini,
-        input_buffer=[],
-        output_buffer=[],
+        input_buffer=bytearray(),
+        output_buffer=PCMRingBuffer(cfg.TELEPHONY_SR * OUTPUT_RING_SEC),
         conversation=[],
         start_time=datetime.now(timezone.utc),
         waybeo_headers=waybeo_headers if waybeo_headers else None,
@@ -1485,12 +2094,14 @@ async def handle_client(client_ws, path: str):
         # Start Gemini connection EARLY (in parallel with waiting for start event)
         # This reduces initial latency by ~4 seconds as Gemini warms up in parallel
         if cfg.LOG_TRANSCRIPTS:
-            print(f"[telephony] 🚀 Starting Gemini connection early...")
-        gemini_connect_task = asyncio.create_task(session.gemini.connect())
+            log.info("[telephony] 🚀 Starting Gemini connection early...")
+        # Eager start: the Gemini dial is already under way before we block on recv()
+        pooled_ws = _gemini_pool.take() if _gemini_pool is not None else None
+        gemini_connect_task = _create_eager_task(session.gemini.connect(pooled_ws))
 
         # Wait for start event to get real UCID
         first = await asyncio.wait_for(client_ws.recv(), timeout=10.0)
-        start_msg = json.loads(first)
+        start_msg = fast_json.loads(first)
         if start_msg.get("event") != "start":
             gemini_connect_task.cancel()
             await client_ws.close(code=1008, reason="Expected start event")
@@ -1498,58 +2109,33 @@ async def handle_client(client_ws, path: str):
 
         # Log start event body for debugging (shows all data Waybeo sends)
         if cfg.DEBUG:
-            # Log keys and small values, skip large binary data
-            safe_start = {k: (v if not isinstance(v, (list, bytes)) or len(str(v)) < 200 else f"<{type(v).__name__}:{len(v)}>") for k, v in start_msg.items()}
-            print(f"[telephony] 📦 Start event payload: {json.dumps(safe_start, default=str)}")
+            # Log keys and small values, skip large binary data. Long lists are
+            # judged by element count rather than by stringifying them first.
+            safe_start = {
+                k: (v if not isinstance(v, list) or len(v) <= START_LOG_MAX_LIST else f"<list:{len(v)}>")
+                for k, v in start_msg.items()
+            }
+            log.debug("[telephony] 📦 Start event payload: %s", fast_json.dumps(safe_start))
 
         # Extract UCID - prioritize start event, then Waybeo headers
-        session.ucid = (
-            start_msg.get("ucid")
-            or start_msg.get("start", {}).get("ucid")
-            or start_msg.get("data", {}).get("ucid")
-            or waybeo_headers.get("x-waybeo-ucid", "")
-            or waybeo_headers.get("X-Waybeo-Ucid", "")
-            or waybeo_headers.get("ucid", "")
-            or "UNKNOWN"
-        )
+        session.ucid = _start_field(start_msg, _UCID_SOURCES, headers_lc) or "UNKNOWN"
+
+        _encode_session_payloads(session, cfg)
 
         # Extract customer_number from start event (Waybeo sends it as "did")
-        session.customer_number = (
-            start_msg.get("did")  # Waybeo sends customer number in "did" field
-            or start_msg.get("customer_number")
-            or start_msg.get("caller_number")
-            or start_msg.get("customerId")
-            or start_msg.get("From")
-            or start_msg.get("customer_mobile")
-            or start_msg.get("data", {}).get("did")
-            or start_msg.get("data", {}).get("customer_number")
-            or start_msg.get("data", {}).get("caller_number")
-            or start_msg.get("start", {}).get("did")
-            or waybeo_headers.get("x-waybeo-caller-number", "")
-            or waybeo_headers.get("X-Waybeo-Caller-Number", "")
-            or None
-        )
+        session.customer_number = _start_field(start_msg, _CUSTOMER_NUMBER_SOURCES, headers_lc)
 
         # Extract VMN (Virtual Mobile Number - the Kia number the customer dialed)
-        session.vmn = (
-            start_msg.get("vmn")
-            or start_msg.get("data", {}).get("vmn")
-            or start_msg.get("start", {}).get("vmn")
-            or None
-        )
+        session.vmn = _start_field(start_msg, _VMN_SOURCES, headers_lc)
 
         # Extract store_code: Priority order:
         # 1. VMN→StoreCode mapping from Admin UI (most reliable)
         # 2. Explicit store_code in start event
         # 3. Waybeo headers (legacy)
-        vmn_store_code = _lookup_store_code_by_vmn(agent, session.vmn)
+        vmn_store_code = await _lookup_store_code_by_vmn(agent, session.vmn)
         session.store_code = (
             vmn_store_code
-            or start_msg.get("store_code")
-            or start_msg.get("data", {}).get("store_code")
-            or waybeo_headers.get("x-waybeo-store-code", "")
-            or waybeo_headers.get("X-Waybeo-Store-Code", "")
-            or waybeo_headers.get("store_code", "")
+            or _start_field(start_msg, _STORE_CODE_SOURCES, headers_lc)
             or "1001"  # Default store code when VMN not in mapping
         )
 
@@ -1562,113 +2148,45 @@ async def handle_client(client_ws, path: str):
         }
 
         if cfg.LOG_TRANSCRIPTS:
-            print(f"[{_ist_str()}] [{session.ucid}] 🎬 start event received on path={path}")
+            log.info("[%s] [%s] 🎬 start event received on path=%s", _ist_str(), session.ucid, path)
             if session.customer_number:
-                print(f"[{_ist_str()}] [{session.ucid}] 📱 Customer (DID): {session.customer_number}")
+                log.info("[%s] [%s] 📱 Customer (DID): %s", _ist_str(), session.ucid, session.customer_number)
             if session.vmn:
-                print(f"[{_ist_str()}] [{session.ucid}] 📞 VMN (Kia number): {session.vmn}")
+                log.info("[%s] [%s] 📞 VMN (Kia number): %s", _ist_str(), session.ucid, session.vmn)
             if session.store_code:
                 src = "VMN mapping" if vmn_store_code else "start event"
-                print(f"[{_ist_str()}] [{session.ucid}] 🏪 Store code: {session.store_code} (from {src})")
+                log.info(
+                    "[%s] [%s] 🏪 Store code: %s (from %s)",
+                    _ist_str(), session.ucid, session.store_code, src,
+                )
 
         # Wait for Gemini connection (started earlier for speed)
         await gemini_connect_task
         if cfg.LOG_TRANSCRIPTS:
-            print(f"[{session.ucid}] ✅ Connected to Gemini Live")
+            log.info("[%s] ✅ Connected to Gemini Live", session.ucid)
 
-        # Start audio sender (drip-feeds buffered audio at real-time rate)
-        sender_task = asyncio.create_task(_audio_sender(session, cfg))
-
-        # Start reader task so we catch the greeting audio
-        gemini_task = asyncio.create_task(_gemini_reader(session, audio_processor, cfg))
-
-        # Trigger greeting immediately - don't wait for user audio
-        await session.gemini.trigger_greeting()
-        if cfg.LOG_TRANSCRIPTS:
-            print(f"[{session.ucid}] 🎙️ Greeting triggered")
-
-        # Maximum call duration safeguard (5 minutes = 300 seconds)
-        MAX_CALL_DURATION_SEC = 300
-
-        # Process remaining messages
-        async for raw in client_ws:
-            # Check if call has exceeded maximum duration (safeguard against stuck sessions)
-            elapsed = time.time() - session.call_start_time
-            if elapsed > MAX_CALL_DURATION_SEC and not session.call_ending:
-                print(f"[{session.ucid}] ⏱️ Call exceeded {MAX_CALL_DURATION_SEC}s limit ({int(elapsed)}s elapsed)")
-                print(f"[{session.ucid}] 🚨 Forcing call termination to prevent stuck session")
-                session.call_ending = True
-                
-                # Send hangup if not already sent
-                if not session.hangup_sent:
-                    session.hangup_sent = True
-                    asyncio.create_task(_send_hangup(
-                        session, 
-                        reason="max_duration_exceeded",
-                        cfg=cfg
-                    ))
-                
-                # Close Gemini connection
-                if session.gemini:
-                    asyncio.create_task(session.gemini.close())
-                
-                # Break to trigger cleanup
-                break
+        # Run the sender, Gemini reader and Waybeo receive loop as one unit:
+        # when any of them ends the call (or fails) the others are cancelled.
+        try:
+            async with asyncio.TaskGroup() as tg:
+                # Start audio sender (drip-feeds buffered audio at real-time rate)
+                tg.create_task(_audio_sender(session, cfg))
 
-            try:
-                msg = json.loads(raw)
-            except json.JSONDecodeError:
-                continue
+                # Start reader task so we catch the greeting audio
+                tg.create_task(_gemini_reader(session, audio_processor, cfg))
 
-            event = msg.get("event")
-            if event in {"stop", "end", "close"}:
+                # Trigger greeting immediately - don't wait for user audio
+                await session.gemini.trigger_greeting()
                 if cfg.LOG_TRANSCRIPTS:
-                    print(f"[{session.ucid}] 📞 stop event received")
-                
-                # If we haven't sent hangup yet, send it now as a fallback
-                if not session.hangup_sent:
-                    session.hangup_sent = True
-                    reason = "Call ended by telephony provider"
-                    if cfg.DEBUG:
-                        print(f"[{session.ucid}] 📞 Fallback hangup (stop event)")
-                    # Note: Don't await here to avoid blocking, and stop event means
-                    # the call is already ending on the telephony side
-                
-                break
-
-            if event == "media" and msg.get("data"):
-                samples = msg["data"].get("samples", [])
-                if not samples:
-                    continue
-
-                session.input_buffer.extend(samples)
-
-                # Track audio chunks sent to Gemini
-                chunks_sent = 0
-                while len(session.input_buffer) >= cfg.AUDIO_BUFFER_SAMPLES_INPUT:
-                    chunk = session.input_buffer[: cfg.AUDIO_BUFFER_SAMPLES_INPUT]
-                    session.input_buffer = session.input_buffer[cfg.AUDIO_BUFFER_SAMPLES_INPUT :]
-
-                    samples_np = audio_processor.waybeo_samples_to_np(chunk)
-                    audio_b64 = audio_processor.process_input_8k_to_gemini_16k_b64(samples_np)
-                    await session.gemini.send_audio_b64_pcm16(audio_b64)
-                    chunks_sent += 1
-
-                # Audio chunk logging is too verbose - removed to keep logs clean
-                # Transcripts still show what Gemini hears/says
-
-        print(f"[{session.ucid}] 📞 Main WS loop ended (normal exit)")
+                    log.info("[%s] 🎙️ Greeting triggered", session.ucid)
+
+                tg.create_task(_client_receive_loop(session, audio_processor, cfg))
+        except BaseExceptionGroup as eg:
+            # Surface the first real error unwrapped so the handlers below apply
+            errors = [e for e in eg.exceptions if not isinstance(e, _CallEnded)]
+            if errors:
+                raise errors[0]
         session.closed = True
-        gemini_task.cancel()
-        sender_task.cancel()
-        try:
-            await gemini_task
-        except asyncio.CancelledError:
-            pass
-        try:
-            await sender_task
-        except asyncio.CancelledError:
-            pass
 
         # Save call data on normal completion
         await _save_call_data(session, cfg)
@@ -1677,11 +2195,11 @@ async def handle_client(client_ws, path: str):
         await client_ws.close(code=1008, reason="Timeout waiting for start event")
     except ConnectionClosed as e:
         # Save data even on connection close
-        print(f"[{session.ucid}] 📞 Waybeo WS closed: code={e.code}, reason={e.reason}")
+        log.info("[%s] 📞 Waybeo WS closed: code=%s, reason=%s", session.ucid, e.code, e.reason)
         await _save_call_data(session, cfg)
     except Exception as e:
         if cfg.DEBUG:
-            print(f"[{session.ucid}] ❌ Telephony handler error: {e}")
+            log.debug("[%s] ❌ Telephony handler error: %s", session.ucid, e)
         # Save data even on error
         await _save_call_data(session, cfg)
     finally:
@@ -1692,13 +2210,21 @@ async def handle_client(client_ws, path: str):
             pass
 
 
-def _parse_iso_datetime(value: Optional[str]) -> Optional[datetime]:
-    if not value:
-        return None
-    try:
-        return datetime.fromisoformat(value.replace("Z", ""))
-    except ValueError:
-        return None
+def _to_ist(dt: Optional[datetime]) -> Optional[datetime]:
+    """Express a payload timestamp in IST (naive values are taken to already be IST)."""
+    if dt is None or dt.tzinfo is IST:
+        return dt
+    if dt.tzinfo is None:
+        return dt.replace(tzinfo=IST)
+    return dt.astimezone(IST)
+
+
+# Payload language detection: an entry counts as English when its lowercased text
+# contains one of these English markers and none of the Hindi ones. Plain substring
+# alternations (no word boundaries), matching the `w in text` checks they replace,
+# so each pattern scans a text once instead of once per marker.
+_PAYLOAD_ENGLISH_RE = re.compile("yes|no|please|thank|want|interested")
+_PAYLOAD_HINDI_RE = re.compile("ji|haan|nahi|aap|hai|mein|kya|naam")
 
 
 async def _save_call_data(session: TelephonySession, cfg: Config) -> None:
@@ -1706,12 +2232,35 @@ async def _save_call_data(session: TelephonySession, cfg: Config) -> None:
     Save call data to files, push to Admin UI, and deliver to external webhooks.
     Called at end of call (normal, disconnect, or error).
     """
+    try:
+        await _persist_call_data(session, cfg)
+    finally:
+        # Normally consumed by read_transcript_spool; an early return or an
+        # error before the read-back would otherwise leave it on disk
+        if session.spooled_entries:
+            await _discard_transcript_spool(session, cfg)
+
+
+async def _discard_transcript_spool(session: TelephonySession, cfg: Config) -> None:
+    # An in-flight append would recreate the file after the unlink
+    if session.spool_write is not None:
+        try:
+            await session.spool_write
+        except Exception:
+            pass
+    storage = AgentDataStorage(session.agent, cfg)
+    await asyncio.get_running_loop().run_in_executor(
+        None, storage.discard_transcript_spool, session.ucid, session.spool_id
+    )
+
+
+async def _persist_call_data(session: TelephonySession, cfg: Config) -> None:
     if session.ucid == "UNKNOWN":
         return
 
     if not session.conversation:
         if cfg.DEBUG:
-            print(f"[{session.ucid}] ⚠️ No conversation to save")
+            log.debug("[%s] ⚠️ No conversation to save", session.ucid)
         return
 
     end_time_utc = datetime.now(timezone.utc)
@@ -1720,7 +2269,11 @@ async def _save_call_data(session: TelephonySession, cfg: Config) -> None:
     end_time = end_time_utc.astimezone(IST)
     start_time_ist = session.start_time.astimezone(IST) if session.start_time else end_time
 
-    print(f"[{_ist_str()}] [{session.ucid}] 💾 Saving call data ({len(session.conversation)} entries, {duration_sec}s)")
+    total_entries = session.spooled_entries + len(session.conversation)
+    log.info(
+        "[%s] [%s] 💾 Saving call data (%s entries, %ss)",
+        _ist_str(), session.ucid, total_entries, duration_sec,
+    )
 
     try:
         # Initialize storage and clients
@@ -1731,16 +2284,42 @@ async def _save_call_data(session: TelephonySession, cfg: Config) -> None:
             customer_number=session.customer_number,
             store_code=session.store_code,
         )
-        admin_client = AdminClient(cfg)
+        admin_client = AdminClient(cfg, http_session=_get_http_session())
 
-        # Fetch agent config for webhook endpoints
-        agent_config = admin_client.fetch_agent_config(session.agent)
+        # Agent config for webhook endpoints and payload templates. Same Admin UI
+        # document the call start loaded, so reuse its TTL cache (cleared via
+        # /cache/clear when the config is saved) instead of a blocking GET per call.
+        agent_config = await _fetch_agent_config_from_api(session.agent)
 
-        # Save transcript first, then build payload from saved transcript
-        transcript_path = storage.save_transcript(
-            call_id=session.ucid,
-            conversation=session.conversation,
-            metadata={
+        # File reads/writes below run on the default executor: a long call's
+        # transcript is a sizeable JSON dump that would otherwise stall every
+        # other call's audio on this loop
+        loop = asyncio.get_running_loop()
+
+        # Let an in-flight spool append finish (it may outlive the reader task);
+        # a failed append puts its entries back into session.conversation
+        if session.spool_write is not None:
+            try:
+                await session.spool_write
+            except Exception:
+                pass
+
+        # Rebuild the full conversation: spooled (older) entries + in-memory tail
+        conversation = session.conversation
+        if session.spooled_entries:
+            spooled = await loop.run_in_executor(
+                None, storage.read_transcript_spool, session.ucid, session.spool_id
+            )
+            conversation = spooled + conversation
+
+        # Save transcript first, then build payload from the transcript as saved
+        # (save_transcript hands back the dict it wrote; no need to re-read the file)
+        transcript_path, transcript_data = await loop.run_in_executor(
+            None,
+            storage.save_transcript,
+            session.ucid,
+            conversation,
+            {
                 "agent": session.agent,
                 "duration_sec": duration_sec,
                 "start_time": start_time_ist.isoformat(),
@@ -1748,28 +2327,29 @@ async def _save_call_data(session: TelephonySession, cfg: Config) -> None:
             },
         )
         if not transcript_path:
-            print(f"[{session.ucid}] ❌ Transcript save failed; skipping payload build")
-            return
-
-        transcript_data = storage.load_transcript(transcript_path)
-        if not transcript_data:
-            print(f"[{session.ucid}] ❌ Transcript load failed; skipping payload build")
+            log.error("[%s] ❌ Transcript save failed; skipping payload build", session.ucid)
             return
 
         transcript_conversation = transcript_data.get("conversation") or []
-        transcript_metadata = transcript_data.get("metadata") or {}
-        transcript_start = _parse_iso_datetime(transcript_metadata.get("start_time"))
-        transcript_end = _parse_iso_datetime(transcript_metadata.get("end_time"))
-        transcript_duration = transcript_metadata.get("duration_sec") or duration_sec
+        # The transcript metadata was written from start_time_ist / end_time /
+        # duration_sec above, so those in-memory values are used directly
+        transcript_duration = duration_sec
 
         # Use Gemini 2.0 Flash for intelligent data extraction (no regex)
-        cfg_instance = Config()
-        if cfg_instance.GEMINI_API_KEY:
-            print(f"[{session.ucid}] 🤖 Using Gemini 2.0 Flash for intelligent extraction...")
+        summary_task: Optional[asyncio.Task] = None
+        if cfg.GEMINI_API_KEY:
+            log.info("[%s] 🤖 Using Gemini 2.0 Flash for intelligent extraction...", session.ucid)
             extractor = GeminiExtractor(
-                api_key=cfg_instance.GEMINI_API_KEY,
-                model=cfg_instance.GEMINI_EXTRACT_MODEL,
+                api_key=cfg.GEMINI_API_KEY,
+                model=cfg.GEMINI_EXTRACT_MODEL,
             )
+            # Summary/sentiment needs only the transcript: run it alongside the
+            # extraction and the webhook deliveries, collect it for the Admin UI push
+            if transcript_conversation:
+                log.info("[%s] 📝 Generating call summary & sentiment...", session.ucid)
+                summary_task = asyncio.create_task(
+                    extractor.generate_summary_and_sentiment(conversation=transcript_conversation)
+                )
             gemini_extracted = await extractor.extract_data(
                 conversation=transcript_conversation,
                 agent_context=f"Agent: {session.agent}, Customer type: automotive",
@@ -1778,25 +2358,37 @@ async def _save_call_data(session: TelephonySession, cfg: Config) -> None:
                 gemini_extracted, transcript_conversation
             )
             extracted_data = build_extracted_map(response_data)
-            print(f"[{session.ucid}] ✅ Gemini extraction complete: {gemini_extracted.get('extraction_notes', 'OK')}")
+            log.info(
+                "[%s] ✅ Gemini extraction complete: %s",
+                session.ucid, gemini_extracted.get('extraction_notes', 'OK'),
+            )
         else:
             # Fallback to regex extraction if no API key (not recommended)
-            print(f"[{session.ucid}] ⚠️ No GEMINI_API_KEY, falling back to regex extraction")
+            log.warning("[%s] ⚠️ No GEMINI_API_KEY, falling back to regex extraction", session.ucid)
             response_data = payload_builder.extract_response_data(transcript_conversation)
             extracted_data = payload_builder.build_extracted_map(response_data)
 
         completion_status = payload_builder.determine_completion_status(response_data)
 
-        transcript_text = "\n".join(
-            f"[{entry.get('timestamp')}] {entry.get('speaker', '').upper()}: {entry.get('text', '')}"
-            for entry in transcript_conversation
-        )
-        user_messages = sum(
-            1 for entry in transcript_conversation if entry.get("speaker") == "user"
-        )
-        assistant_messages = sum(
-            1 for entry in transcript_conversation if entry.get("speaker") == "agent"
-        )
+        # One pass over the conversation for the transcript text, per-speaker
+        # counts and the English-entry count used for language detection
+        transcript_lines = []
+        user_messages = 0
+        assistant_messages = 0
+        english_count = 0
+        for entry in transcript_conversation:
+            speaker = entry.get("speaker", "")
+            text = entry.get("text", "")
+            transcript_lines.append(f"[{entry.get('timestamp')}] {speaker.upper()}: {text}")
+            if speaker == "user":
+                user_messages += 1
+            elif speaker == "agent":
+                assistant_messages += 1
+            # Count entries with common English words and no Hindi markers
+            text_lower = (text or "").lower()
+            if _PAYLOAD_ENGLISH_RE.search(text_lower) and not _PAYLOAD_HINDI_RE.search(text_lower):
+                english_count += 1
+        transcript_text = "\n".join(transcript_lines)
         analytics = {
             "total_exchanges": len(transcript_conversation),
             "user_messages": user_messages,
@@ -1815,36 +2407,23 @@ async def _save_call_data(session: TelephonySession, cfg: Config) -> None:
 
         # Detect language from conversation (check if mostly Hindi or English)
         detected_language = "hindi"  # default
-        english_count = 0
-        hindi_markers = ["ji", "haan", "nahi", "aap", "hai", "mein", "kya", "naam"]
-        for entry in transcript_conversation:
-            text_lower = (entry.get("text") or "").lower()
-            # Count entries with common English words and no Hindi markers
-            if any(w in text_lower for w in ["yes", "no", "please", "thank", "want", "interested"]):
-                if not any(w in text_lower for w in hindi_markers):
-                    english_count += 1
         if english_count > len(transcript_conversation) * 0.3:
             detected_language = "english"
 
         # Build template context with all available data
         # Ensure all timestamps are in IST for payload consistency
-        ctx_start = transcript_start or start_time_ist
-        ctx_end = transcript_end or end_time
-        # If parsed datetimes are naive (no tz info), assume IST; if UTC, convert
-        if ctx_start and ctx_start.tzinfo is None:
-            ctx_start = ctx_start.replace(tzinfo=IST)
-        elif ctx_start and ctx_start.tzinfo == timezone.utc:
-            ctx_start = ctx_start.astimezone(IST)
-        if ctx_end and ctx_end.tzinfo is None:
-            ctx_end = ctx_end.replace(tzinfo=IST)
-        elif ctx_end and ctx_end.tzinfo == timezone.utc:
-            ctx_end = ctx_end.astimezone(IST)
+        ctx_start = _to_ist(start_time_ist)
+        ctx_end = _to_ist(end_time)
 
         # Build extracted data with attempts/attempts_details/remarks for template rendering
-        # Extract from response_data for each field
+        # Extract from response_data for each field (first entry per key_value wins)
+        response_index: Dict[str, Dict[str, Any]] = {}
+        for r in response_data:
+            response_index.setdefault(r.get("key_value"), r)
+
         def get_field_data(key_value: str):
             """Extract attempts, attempts_details, remarks for a given key_value from response_data."""
-            item = next((r for r in response_data if r.get("key_value") == key_value), None)
+            item = response_index.get(key_value)
             if item:
                 return {
                     f"{key_value}_attempts": item.get("attempts", 0),
@@ -1888,9 +2467,9 @@ async def _save_call_data(session: TelephonySession, cfg: Config) -> None:
         if si_template:
             rendered_si = render_payload_template(si_template, template_context)
             if rendered_si.missing_placeholders:
-                print(
-                    f"[{session.ucid}] ⚠️ SI template missing values for: "
-                    f"{', '.join(rendered_si.missing_placeholders)}"
+                log.warning(
+                    "[%s] ⚠️ SI template missing values for: %s",
+                    session.ucid, ', '.join(rendered_si.missing_placeholders),
                 )
             si_payload = rendered_si.payload
         else:
@@ -1906,23 +2485,27 @@ async def _save_call_data(session: TelephonySession, cfg: Config) -> None:
         # Do NOT inject extra fields like agent_slug here - that would alter the user's template
         si_webhook_payload = dict(si_payload) if isinstance(si_payload, dict) else si_payload
 
-        # Save clean SI payload to local file
-        storage.save_si_payload(session.ucid, si_webhook_payload)
+        # Save clean SI payload to local file (written while the webhooks are in flight)
+        si_saved = loop.run_in_executor(None, storage.save_si_payload, session.ucid, si_webhook_payload)
 
-        # Deliver to external webhooks if configured (before Admin UI push to capture responses)
+        # Deliver to external webhooks if configured (before Admin UI push to capture responses).
+        # The SI and Waybeo deliveries are independent, so they are sent concurrently.
         if agent_config:
+            si_delivery = None
+            waybeo_delivery = None
+
             # SI webhook
             si_endpoint = agent_config.get("siEndpointUrl")
             si_auth = agent_config.get("siAuthHeader")
             if si_endpoint:
-                print(f"[{session.ucid}] 📤 Delivering to SI webhook: {si_endpoint[:50]}...")
-                si_result = await admin_client.push_to_si_webhook(
+                log.info("[%s] 📤 Delivering to SI webhook: %s...", session.ucid, si_endpoint[:50])
+                # Started now, so it is already in flight while the Waybeo payload renders
+                si_delivery = asyncio.create_task(admin_client.push_to_si_webhook(
                     payload=si_webhook_payload,
                     endpoint_url=si_endpoint,
                     auth_header=si_auth,
                     call_id=session.ucid,
-                )
-                session.si_webhook_response = si_result
+                ))
 
             # Waybeo webhook
             waybeo_endpoint = agent_config.get("waybeoEndpointUrl")
@@ -1933,9 +2516,9 @@ async def _save_call_data(session: TelephonySession, cfg: Config) -> None:
                         waybeo_template, template_context
                     )
                     if rendered_waybeo.missing_placeholders:
-                        print(
-                            f"[{session.ucid}] ⚠️ Waybeo template missing values for: "
-                            f"{', '.join(rendered_waybeo.missing_placeholders)}"
+                        log.warning(
+                            "[%s] ⚠️ Waybeo template missing values for: %s",
+                            session.ucid, ', '.join(rendered_waybeo.missing_placeholders),
                         )
                     waybeo_payload = rendered_waybeo.payload
                 else:
@@ -1954,29 +2537,39 @@ async def _save_call_data(session: TelephonySession, cfg: Config) -> None:
                 # Store waybeo_payload in session for Admin UI (v0.6+)
                 session.waybeo_payload = waybeo_payload
                 
-                print(f"[{session.ucid}] 📤 Delivering to Waybeo webhook: {waybeo_endpoint[:50]}...")
-                waybeo_result = await admin_client.push_to_waybeo_webhook(
+                log.info("[%s] 📤 Delivering to Waybeo webhook: %s...", session.ucid, waybeo_endpoint[:50])
+                waybeo_delivery = admin_client.push_to_waybeo_webhook(
                     payload=waybeo_payload,
                     endpoint_url=waybeo_endpoint,
                     auth_header=waybeo_auth,
                     call_id=session.ucid,
                 )
-                session.waybeo_webhook_response = waybeo_result
 
-        # Generate summary and sentiment using Gemini 2.0 Flash
+            if si_delivery and waybeo_delivery:
+                session.si_webhook_response, session.waybeo_webhook_response = await asyncio.gather(
+                    si_delivery, waybeo_delivery
+                )
+            elif si_delivery:
+                session.si_webhook_response = await si_delivery
+            elif waybeo_delivery:
+                session.waybeo_webhook_response = await waybeo_delivery
+
+        await si_saved
+
+        # Summary and sentiment from Gemini 2.0 Flash (started alongside the extraction)
         summary_data = {"summary": None, "sentiment": None, "sentimentScore": None}
-        if cfg_instance.GEMINI_API_KEY and transcript_conversation:
+        if summary_task is not None:
             try:
-                print(f"[{session.ucid}] 📝 Generating call summary & sentiment...")
-                summary_data = await extractor.generate_summary_and_sentiment(
-                    conversation=transcript_conversation,
-                )
+                summary_data = await summary_task
                 if summary_data.get("summary"):
-                    print(f"[{session.ucid}] ✅ Summary generated - sentiment: {summary_data.get('sentiment')}")
+                    log.info(
+                        "[%s] ✅ Summary generated - sentiment: %s",
+                        session.ucid, summary_data.get('sentiment'),
+                    )
                 else:
-                    print(f"[{session.ucid}] ⚠️ Summary generation returned empty")
+                    log.warning("[%s] ⚠️ Summary generation returned empty", session.ucid)
             except Exception as e:
-                print(f"[{session.ucid}] ⚠️ Summary generation error: {e}")
+                log.warning("[%s] ⚠️ Summary generation error: %s", session.ucid, e)
 
         # Build Admin UI payload with extra tracking fields
         admin_payload = dict(si_webhook_payload) if isinstance(si_webhook_payload, dict) else {}
@@ -2001,7 +2594,7 @@ async def _save_call_data(session: TelephonySession, cfg: Config) -> None:
         await admin_client.push_call_data(admin_payload, session.ucid)
 
     except Exception as e:
-        print(f"[{session.ucid}] ❌ Error saving call data: {e}")
+        log.error("[%s] ❌ Error saving call data: %s", session.ucid, e)
 
 
 async def handle_cache_clear(request):
@@ -2018,7 +2611,7 @@ async def handle_cache_clear(request):
             **result
         })
     except Exception as e:
-        print(f"[telephony] ❌ Cache clear error: {e}")
+        log.error("[telephony] ❌ Cache clear error: %s", e)
         return aiohttp.web.json_response({
             "success": False,
             "error": str(e)
@@ -2027,7 +2620,11 @@ async def handle_cache_clear(request):
 
 async def handle_cache_status(request):
     """HTTP endpoint to check cache status."""
-    cached_agents = list(_agent_config_cache.keys())
+    now = time.monotonic()
+    cached_agents = [
+        slug for slug, entry in _agent_config_cache.items()
+        if entry["data"] is not None and entry["expires_at"] > now
+    ]
     return aiohttp.web.json_response({
         "cached_agents": cached_agents,
         "count": len(cached_agents)
@@ -2044,29 +2641,71 @@ async def start_admin_http_server(port: int = 8082):
     await runner.setup()
     site = aiohttp.web.TCPSite(runner, '0.0.0.0', port)
     await site.start()
-    print(f"✅ Admin HTTP server listening on http://0.0.0.0:{port}")
-    print(f"   - POST /cache/clear - Clear agent config cache")
-    print(f"   - GET  /cache/status - View cached agents")
+    log.info("✅ Admin HTTP server listening on http://0.0.0.0:%s", port)
+    log.info("   - POST /cache/clear - Clear agent config cache")
+    log.info("   - GET  /cache/status - View cached agents")
+
+
+def _setup_logging(cfg: Config) -> logging.handlers.QueueListener:
+    """
+    Send `log` records to stdout from a background thread.
+
+    Records are formatted as the bare message, so lines look as they did
+    when the service printed them. The "telephony.*" module loggers
+    propagate here too, leaving this thread the only writer on stdout once
+    logging is set up. Returns the started listener; stop it on shutdown to
+    flush pending lines.
+    """
+    records: queue.SimpleQueue = queue.SimpleQueue()
+    stream = logging.StreamHandler(sys.stdout)
+    stream.setFormatter(logging.Formatter("%(message)s"))
+    listener = logging.handlers.QueueListener(records, stream)
+
+    log.addHandler(logging.handlers.QueueHandler(records))
+    log.setLevel(logging.DEBUG if cfg.DEBUG else logging.INFO)
+    log.propagate = False
+    listener.start()
+    return listener
 
 
 async def main() -> None:
     cfg = Config()
     Config.validate(cfg)
     cfg.print_config()
+    log_listener = _setup_logging(cfg)
 
     # Start admin HTTP server for cache management (non-blocking)
     admin_port = int(os.getenv("ADMIN_HTTP_PORT", "8082"))
     asyncio.create_task(start_admin_http_server(admin_port))
 
+    global _gemini_pool
+    if cfg.GEMINI_WARM_POOL > 0:
+        _gemini_pool = GeminiConnectionPool(
+            GEMINI_SERVICE_URL, cfg.GEMINI_WARM_POOL, cfg.GEMINI_WARM_POOL_MAX_IDLE_SEC
+        )
+        _gemini_pool.start()
+
     # websockets.serve passes (websocket, path) for the legacy API; handler accepts both.
-    async with websockets.serve(handle_client, cfg.HOST, cfg.PORT):
-        print(f"✅ Telephony WS listening on ws://{cfg.HOST}:{cfg.PORT}{cfg.WS_PATH}")
-        await asyncio.Future()
+    # permessage-deflate is declined: compressing every 20ms media frame costs
+    # zlib CPU on both ends for a few hundred bytes of JSON each.
+    try:
+        async with websockets.serve(handle_client, cfg.HOST, cfg.PORT, compression=None):
+            log.info("✅ Telephony WS listening on ws://%s:%s%s", cfg.HOST, cfg.PORT, cfg.WS_PATH)
+            await asyncio.Future()
+    finally:
+        if _gemini_pool is not None:
+            await _gemini_pool.close()
+        await _close_http_session()
+        _AUDIO_POOL.shutdown(wait=False)
+        log_listener.stop()
 
 
 if __name__ == "__main__":
     try:
-        asyncio.run(main())
+        # uvloop (libuv) when installed: faster socket I/O, timers and callbacks
+        loop_factory = uvloop.new_event_loop if uvloop is not None else None
+        with asyncio.Runner(loop_factory=loop_factory) as runner:
+            runner.run(main())
     except KeyboardInterrupt:
         print("\n👋 Telephony service stopped")
 
@@ -21,10 +21,13 @@ Constructs the SI API payload format from conversation transcripts:
 from __future__ import annotations
 
 import re
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional, Tuple
 
 
+# SI payload timestamp format
+_TIMESTAMP_FMT = "%Y-%m-%d %H:%M:%S"
+
 # Customer name mapping for agents
 AGENT_CUSTOMER_NAMES = {
     "spotlight": "Kia",
@@ -35,7 +38,7 @@ AGENT_CUSTOMER_NAMES = {
 
 # Key patterns to extract from conversation
 # Maps key_value to (label, regex patterns for extraction)
-EXTRACTION_PATTERNS: Dict[str, Tuple[str, List[str]]] = {
+_EXTRACTION_PATTERN_SOURCES: Dict[str, Tuple[str, List[str]]] = {
     "name": (
         "What's your name",
         [
@@ -72,6 +75,12 @@ EXTRACTION_PATTERNS: Dict[str, Tuple[str, List[str]]] = {
         ],
     ),
 }
+# Compiled once at import instead of on every payload build. No IGNORECASE:
+# patterns only ever run on lowercased user text and their literals are lowercase.
+EXTRACTION_PATTERNS: Dict[str, Tuple[str, List[re.Pattern]]] = {
+    key_value: (key_label, [re.compile(p) for p in patterns])
+    for key_value, (key_label, patterns) in _EXTRACTION_PATTERN_SOURCES.items()
+}
 
 
 class SIPayloadBuilder:
@@ -93,30 +102,41 @@ class SIPayloadBuilder:
     def extract_response_data(
         self,
         conversation: List[Dict[str, Any]],
+        capture_timing: bool = True,
     ) -> List[Dict[str, Any]]:
         """
         Extract key response data from conversation.
 
         Args:
             conversation: List of {timestamp, speaker, text} entries
+            capture_timing: Scan the conversation for when each value was said
+                (attempts_details); pass False when the consumer ignores it
 
         Returns:
             List of response_data items in SI format
         """
         response_data = []
+        # (conversation index, lowercased text) of each user entry, built once
+        # and shared by pattern matching and every key's timing lookup
         user_texts = [
-            entry for entry in conversation if entry.get("speaker") == "user"
+            (i, entry.get("text", "").lower())
+            for i, entry in enumerate(conversation)
+            if entry.get("speaker") == "user"
         ]
 
         # Combine all user text for pattern matching
-        all_user_text = " ".join(entry.get("text", "") for entry in user_texts).lower()
+        all_user_text = " ".join(text for _, text in user_texts)
 
         for key_value, (key_label, patterns) in EXTRACTION_PATTERNS.items():
             extracted = self._extract_value(all_user_text, patterns, key_value)
 
             if extracted:
                 # Find timing from conversation
-                timing = self._find_timing_for_key(conversation, extracted, key_value)
+                timing = (
+                    self._find_timing_for_key(conversation, extracted, key_value, user_texts)
+                    if capture_timing
+                    else None
+                )
 
                 response_data.append({
                     "key_label": key_label,
@@ -141,12 +161,12 @@ class SIPayloadBuilder:
     def _extract_value(
         self,
         text: str,
-        patterns: List[str],
+        patterns: List[re.Pattern],
         key_value: str,
     ) -> Optional[str]:
-        """Extract value using patterns."""
+        """Extract value from lowercased text using compiled patterns."""
         for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+            match = pattern.search(text)
             if match:
                 # For patterns with capture groups, return the group
                 if match.groups():
@@ -165,11 +185,11 @@ class SIPayloadBuilder:
         if not value:
             return None
         if isinstance(value, datetime):
-            return value.strftime("%Y-%m-%d %H:%M:%S")
+            return value.strftime(_TIMESTAMP_FMT)
         if isinstance(value, str):
             try:
                 parsed = datetime.fromisoformat(value.replace("Z", ""))
-                return parsed.strftime("%Y-%m-%d %H:%M:%S")
+                return parsed.strftime(_TIMESTAMP_FMT)
             except ValueError:
                 return value
         return None
@@ -179,12 +199,24 @@ class SIPayloadBuilder:
         conversation: List[Dict[str, Any]],
         value: str,
         key_value: str,
+        user_texts: Optional[List[Tuple[int, str]]] = None,
     ) -> Optional[Dict[str, Any]]:
-        """Find approximate timing for when a value was captured."""
+        """
+        Find approximate timing for when a value was captured.
+
+        `user_texts` is the precomputed (index, lowercased text) list from
+        extract_response_data; it is rebuilt here when not given.
+        """
+        if user_texts is None:
+            user_texts = [
+                (i, entry.get("text", "").lower())
+                for i, entry in enumerate(conversation)
+                if entry.get("speaker") == "user"
+            ]
         value_lower = value.lower()
-        for i, entry in enumerate(conversation):
-            if entry.get("speaker") == "user" and value_lower in entry.get("text", "").lower():
-                start_time = self._format_timestamp(entry.get("timestamp"))
+        for i, text_lower in user_texts:
+            if value_lower in text_lower:
+                start_time = self._format_timestamp(conversation[i].get("timestamp"))
                 end_time = None
                 if i + 1 < len(conversation):
                     end_time = self._format_timestamp(conversation[i + 1].get("timestamp"))
@@ -239,6 +271,7 @@ class SIPayloadBuilder:
         dealer_routing: Optional[Dict[str, Any]] = None,
         language: Optional[Dict[str, str]] = None,
         include_transcript: bool = True,
+        capture_timing: bool = True,
     ) -> Dict[str, Any]:
         """
         Build complete SI webhook payload.
@@ -251,17 +284,22 @@ class SIPayloadBuilder:
             dealer_routing: Dealer routing info
             language: Language configuration
             include_transcript: Whether to include raw transcript (for Admin UI)
+            capture_timing: Fill attempts_details with when each value was said
 
         Returns:
             Complete SI payload dict
         """
-        response_data = self.extract_response_data(conversation)
+        response_data = self.extract_response_data(conversation, capture_timing=capture_timing)
         completion_status = self.determine_completion_status(response_data)
 
-        now = datetime.utcnow()
+        # Naive UTC, as datetime.utcnow() gave (deprecated since 3.12)
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
         start = start_time or now
         end = end_time or now
         duration = duration_sec or int((end - start).total_seconds())
+        # end time appears in three fields; format it once
+        start_str = start.strftime(_TIMESTAMP_FMT)
+        end_str = end.strftime(_TIMESTAMP_FMT)
 
         customer_number = self.customer_number or ""
         if isinstance(customer_number, str) and customer_number.isdigit():
@@ -274,8 +312,8 @@ class SIPayloadBuilder:
             "call_ref_id": self.call_id,
             "call_vendor": "Waybeo",
             "recording_url": "",
-            "start_time": start.strftime("%Y-%m-%d %H:%M:%S"),
-            "end_time": end.strftime("%Y-%m-%d %H:%M:%S"),
+            "start_time": start_str,
+            "end_time": end_str,
             "duration": duration,
             "store_code": self.store_code or "",
             "customer_number": customer_number,
@@ -286,10 +324,10 @@ class SIPayloadBuilder:
             "dealer_routing": dealer_routing or {
                 "status": False,
                 "reason": "User decided",
-                "time": end.strftime("%Y-%m-%d %H:%M:%S"),
+                "time": end_str,
             },
             "dropoff": {
-                "time": end.strftime("%Y-%m-%d %H:%M:%S"),
+                "time": end_str,
                 "action": "email",
             },
             "completion_status": completion_status,
@@ -1,9 +1,9 @@
 from __future__ import annotations
 
 import re
-from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Any, Dict, Iterable, List, Optional, Tuple
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 
 
 PLACEHOLDER_PATTERN = re.compile(r"\{([^{}]+)\}")
@@ -12,6 +12,36 @@ CONDITIONAL_PATTERN = re.compile(
 )
 
 
+# Standard SI payload field order (see _reorder_si_payload)
+_SI_FIELD_ORDER = (
+    "id",
+    "customer_name",
+    "call_ref_id",
+    "call_vendor",
+    "recording_url",
+    "start_time",
+    "end_time",
+    "duration",
+    "provider",
+    "call_direction",
+    "store_code",
+    "customer_number",
+    "language",
+    "dealer_routing",
+    "dropoff",
+    "completion_status",
+    "response_data",
+)
+_RESPONSE_FIELD_ORDER = (
+    "key_label",
+    "key_value",
+    "key_response",
+    "attempts",
+    "attempts_details",
+    "remarks",
+)
+
+
 @dataclass
 class TemplateRenderResult:
     payload: Any
@@ -19,6 +49,9 @@ class TemplateRenderResult:
 
 
 def _parse_conditional(expr: str) -> Optional[Tuple[str, str, str]]:
+    # The conditional grammar needs a "?"; plain paths skip the regex
+    if "?" not in expr:
+        return None
     match = CONDITIONAL_PATTERN.match(expr)
     if not match:
         return None
@@ -29,8 +62,12 @@ def _parse_conditional(expr: str) -> Optional[Tuple[str, str, str]]:
 
 
 def _get_value_from_path(data: Dict[str, Any], path: str) -> Any:
+    return _get_value_from_parts(data, tuple(path.split(".")))
+
+
+def _get_value_from_parts(data: Dict[str, Any], parts: Tuple[str, ...]) -> Any:
     current: Any = data
-    for part in path.split("."):
+    for part in parts:
         if isinstance(current, dict) and part in current:
             current = current[part]
         else:
@@ -39,63 +76,88 @@ def _get_value_from_path(data: Dict[str, Any], path: str) -> Any:
 
 
 def _stringify(value: Any) -> str:
-    if value is None:
-        return ""
-    if isinstance(value, (dict, list)):
-        return str(value)
-    return str(value)
+    # dicts/lists embedded in a larger string use their str() form too
+    return "" if value is None else str(value)
+
+
+# A placeholder expression, parsed: (path as written, path split on ".",
+# (true_value, false_value) for `path ? 'a' : 'b'` conditionals else None)
+_Expr = Tuple[str, Tuple[str, ...], Optional[Tuple[str, str]]]
+
+
+def _compile_expr(expr: str) -> _Expr:
+    conditional = _parse_conditional(expr)
+    if conditional:
+        path, true_value, false_value = conditional
+        return path, tuple(path.split(".")), (true_value, false_value)
+    return expr, tuple(expr.split(".")), None
+
+
+@lru_cache(maxsize=1024)
+def _compile_string(value: str) -> Optional[Tuple[bool, Tuple[Any, ...]]]:
+    """
+    Parse a template string once (agent templates are the same on every call).
+
+    Returns None when the string has no placeholders, else (whole, segments):
+    `whole` is True when the string is exactly one placeholder (its value is
+    substituted as-is, not stringified); `segments` alternates literal text
+    (even indexes) and compiled expressions (odd indexes).
+    """
+    matches = list(PLACEHOLDER_PATTERN.finditer(value))
+    if not matches:
+        return None
+
+    if len(matches) == 1 and value.strip() == matches[0].group(0):
+        return True, ("", _compile_expr(matches[0].group(1).strip()))
+
+    segments: List[Any] = []
+    pos = 0
+    for match in matches:
+        segments.append(value[pos:match.start()])
+        segments.append(_compile_expr(match.group(1).strip()))
+        pos = match.end()
+    segments.append(value[pos:])
+    return False, tuple(segments)
+
+
+def _resolve_expr(expr: _Expr, context: Dict[str, Any], missing: Set[str]) -> Any:
+    path, parts, conditional = expr
+    resolved = _get_value_from_parts(context, parts)
+    if resolved is None:
+        missing.add(path)
+    if conditional:
+        true_value, false_value = conditional
+        return true_value if resolved else false_value
+    return "" if resolved is None else resolved
 
 
 def _render_string(
     value: str,
     context: Dict[str, Any],
-    missing: List[str],
+    missing: Set[str],
 ) -> Any:
-    matches = list(PLACEHOLDER_PATTERN.finditer(value))
-    if not matches:
+    # Most leaves are plain literals: skip the parse cache (and keep them out of it)
+    if "{" not in value:
         return value
 
-    if value.strip() == matches[0].group(0) and len(matches) == 1:
-        expr = matches[0].group(1).strip()
-        conditional = _parse_conditional(expr)
-        if conditional:
-            path, true_value, false_value = conditional
-            resolved = _get_value_from_path(context, path)
-            if resolved is None:
-                missing.append(path)
-            return true_value if resolved else false_value
-
-        resolved = _get_value_from_path(context, expr)
-        if resolved is None:
-            missing.append(expr)
-            return ""
-        return resolved
-
-    rendered = value
-    for match in matches:
-        expr = match.group(1).strip()
-        conditional = _parse_conditional(expr)
-        if conditional:
-            path, true_value, false_value = conditional
-            resolved = _get_value_from_path(context, path)
-            if resolved is None:
-                missing.append(path)
-            replacement = true_value if resolved else false_value
-        else:
-            resolved = _get_value_from_path(context, expr)
-            if resolved is None:
-                missing.append(expr)
-                replacement = ""
-            else:
-                replacement = _stringify(resolved)
-        rendered = rendered.replace(match.group(0), replacement)
-    return rendered
+    compiled = _compile_string(value)
+    if compiled is None:
+        return value
+
+    whole, segments = compiled
+    if whole:
+        return _resolve_expr(segments[1], context, missing)
+
+    return "".join(
+        segment if i % 2 == 0 else _stringify(_resolve_expr(segment, context, missing))
+        for i, segment in enumerate(segments)
+    )
 
 
 def _render_value(
     value: Any,
     context: Dict[str, Any],
-    missing: List[str],
+    missing: Set[str],
 ) -> Any:
     if isinstance(value, dict):
         return {
@@ -116,56 +178,22 @@ def _reorder_si_payload(payload: Any) -> Any:
     """
     if not isinstance(payload, dict):
         return payload
-    
-    # Define the standard SI payload field order
-    field_order = [
-        "id",
-        "customer_name",
-        "call_ref_id",
-        "call_vendor",
-        "recording_url",
-        "start_time",
-        "end_time",
-        "duration",
-        "provider",
-        "call_direction",
-        "store_code",
-        "customer_number",
-        "language",
-        "dealer_routing",
-        "dropoff",
-        "completion_status",
-        "response_data",
-    ]
-    
-    # Reorder top-level fields
-    ordered = OrderedDict()
-    for key in field_order:
-        if key in payload:
-            ordered[key] = payload[key]
-    
-    # Add any extra fields not in the standard order
+
+    # Standard fields first, then any extra fields in their original order
+    # (plain dicts keep insertion order)
+    ordered = {key: payload[key] for key in _SI_FIELD_ORDER if key in payload}
     for key, value in payload.items():
         if key not in ordered:
             ordered[key] = value
-    
+
     # Reorder response_data item fields if present
     if "response_data" in ordered and isinstance(ordered["response_data"], list):
-        response_field_order = [
-            "key_label",
-            "key_value",
-            "key_response",
-            "attempts",
-            "attempts_details",
-            "remarks",
-        ]
         ordered_items = []
         for item in ordered["response_data"]:
             if isinstance(item, dict):
-                ordered_item = OrderedDict()
-                for field in response_field_order:
-                    if field in item:
-                        ordered_item[field] = item[field]
+                ordered_item = {
+                    field: item[field] for field in _RESPONSE_FIELD_ORDER if field in item
+                }
                 for field, value in item.items():
                     if field not in ordered_item:
                         ordered_item[field] = value
@@ -173,7 +201,7 @@ def _reorder_si_payload(payload: Any) -> Any:
             else:
                 ordered_items.append(item)
         ordered["response_data"] = ordered_items
-    
+
     return ordered
 
 
@@ -181,10 +209,10 @@ def render_payload_template(
     template: Any,
     context: Dict[str, Any],
 ) -> TemplateRenderResult:
-    missing: List[str] = []
+    missing: Set[str] = set()
     rendered = _render_value(template, context, missing)
     
     # Reorder SI payload fields for consistent formatting
     rendered = _reorder_si_payload(rendered)
     
-    return TemplateRenderResult(payload=rendered, missing_placeholders=sorted(set(missing)))
+    return TemplateRenderResult(payload=rendered, missing_placeholders=sorted(missing))